@@ -1,12 +1,20 @@
+import multiprocessing
+import os
+
 from flask import Flask, request
 from flask_cors import CORS
 
 from bp.dbms import get_db
+from bp.dbms.mariadb import close_db
+from bp.dbms.migrations import run_migrations
 from bp import (
     dbms, test, routes
 )
 from bp.utils.loggers import setup_logger
 from bp.routes import document_token
+from bp.services.document_token.parser_pool import get_parser_pool
+from bp.services.document_token import tokenizer_registry
+from config import parser_pool_enabled, db_migrate_on_startup
 
 
 logger = setup_logger()
@@ -30,6 +38,31 @@ CORS(app, resources={
 for bp in blueprints:
     app.register_blueprint(bp)
 
+# 요청마다 빌린 DB 연결을 요청이 끝나면 풀에 반납
+app.teardown_appcontext(close_db)
+
+
+def _serves_requests() -> bool:
+    """
+    요청을 처리하는 프로세스인지 확인합니다.
+    직접 실행(debug=True)할 때의 리로더 감시 프로세스와, 이 모듈을 다시 불러오는 파서 워커(spawn) 프로세스는 제외합니다.
+    gunicorn 등 WSGI 서버로 실행하면 각 워커 프로세스가 요청을 처리합니다.
+    """
+    if multiprocessing.parent_process() is not None:
+        return False
+    return __name__ != '__main__' or os.environ.get("WERKZEUG_RUN_MAIN") == "true"
+
+
+# 스키마 생성/마이그레이션은 repository 생성 시가 아니라 요청을 처리하는 프로세스가 시작할 때 실행
+# (여러 프로세스가 동시에 시작해도 마이그레이션은 DB 잠금으로 한 번만 적용되며, 파서 워커 프로세스에서는 실행하지 않음)
+# 첫 요청이 기다리지 않도록 Kiwi와 파서 워커도 미리 준비
+if _serves_requests():
+    if db_migrate_on_startup:
+        run_migrations()
+    tokenizer_registry.warm_up()
+    if parser_pool_enabled:
+        get_parser_pool().warm_up()
+
 if __name__ == '__main__':
     logger.info("API server is running")
     app.run(host="0.0.0.0", port=9999, debug=True)
@@ -1,5 +1,5 @@
 from flask import Blueprint, request, jsonify
-from bp.dbms.mariadb import get_db  # 🔹 DB 접속 함수 불러오기
+from bp.dbms.mariadb import get_db, get_pool  # 🔹 DB 접속 함수 불러오기
 
 bp = Blueprint('dbms', __name__, url_prefix='/dbms')
 
@@ -12,3 +12,11 @@ bp = Blueprint('dbms', __name__, url_prefix='/dbms')
 #         return jsonify({'success': True, 'db_status': 'connected'}), 200
 #     except Exception as e:
 #         return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@bp.route('/pool', methods=["GET"])
+def dbms_pool():
+    """
+    DB 연결 풀 상태 (사용 중/유휴 연결 수, 대기 횟수와 시간, 포화도)
+    """
+    return jsonify({'success': True, 'pool': get_pool().metrics()}), 200
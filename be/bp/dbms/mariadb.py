@@ -1,25 +1,26 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
 import pymysql
+from pymysql.constants import SERVER_STATUS
+from flask import g, has_app_context
 
-from config import host, port, user, password, db_name
+from config import (
+    host, port, user, password, db_name, bulk_insert_mode,
+    db_pool_min_size, db_pool_max_size, db_pool_idle_timeout, db_pool_borrow_timeout
+)
+from bp.utils.loggers import setup_logger
 
+logger = setup_logger()
 
-import pymysql
-from flask import g, current_app
-
-# def get_db():
-#     if 'db' not in g:
-#         g.db = pymysql.connect(
-#             host=host,
-#             user=user,
-#             password=password,
-#             database=db_name,
-#             charset='utf8mb4',
-#             autocommit=True
-#         )
-#     return g.db
 
-def get_db():
-    
+def connect() -> pymysql.connections.Connection:
+    """
+    풀을 거치지 않는 새 연결 (풀 내부, 오래 유지하는 전용 연결, 요청 밖의 get_db()에서 사용)
+    """
     return pymysql.connect(
         host=host,
         port=port,
@@ -27,11 +28,220 @@ def get_db():
         password=password,
         database=db_name,
         charset='utf8mb4',
-        autocommit=True
+        autocommit=True,
+        local_infile=bulk_insert_mode == 'load_data'  # LOAD DATA LOCAL INFILE 적재
     )
 
-# def close_db(e=None):
-#     db = g.pop('db', None)
-#     if db is not None:
-#         db.close()
 
+class PoolTimeoutError(Exception):
+    """풀의 연결이 모두 사용 중이고 대기 시간 안에 반납되지 않음"""
+
+
+class PooledConnection:
+    """
+    풀에서 빌린 연결의 대리 객체
+
+    pymysql 연결의 메서드(cursor, commit, rollback, ping 등)를 그대로 사용할 수 있고,
+    close()는 실제로 연결을 닫지 않고 풀에 반납합니다.
+    요청 단위로 공유하는 연결(shared=True)은 close()를 무시하고 요청이 끝날 때 release()로 반납합니다.
+    """
+
+    def __init__(self, pool: "ConnectionPool", raw: pymysql.connections.Connection, shared: bool = False):
+        self._pool = pool
+        self._raw = raw
+        self._shared = shared
+
+    def __getattr__(self, name):
+        if self._raw is None:
+            raise pymysql.err.InterfaceError("이미 풀에 반납한 연결입니다.")
+        return getattr(self._raw, name)
+
+    def close(self):
+        if not self._shared:
+            self.release()
+
+    def release(self):
+        raw, self._raw = self._raw, None
+        if raw is not None:
+            self._pool.release(raw)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+class ConnectionPool:
+    """
+    스레드 간에 공유하는 pymysql 연결 풀
+
+    - min_size개 연결을 유지하고 최대 max_size개까지 만듦
+    - 빌려줄 때 ping으로 연결 상태를 확인하고, 끊긴 연결은 버리고 새로 만듦
+    - idle_timeout초 넘게 쓰이지 않은 유휴 연결은 min_size를 넘는 만큼 닫음
+    - 모두 사용 중이면 borrow_timeout초까지 반납을 기다리고, 넘으면 PoolTimeoutError
+    """
+
+    def __init__(self, min_size: int, max_size: int, idle_timeout: float, borrow_timeout: float):
+        self.min_size = min_size
+        self.max_size = max(max_size, 1)
+        self.idle_timeout = idle_timeout
+        self.borrow_timeout = borrow_timeout
+        self.pid = os.getpid()
+
+        self._idle = deque()  # (연결, 반납 시각)
+        self._in_use = 0
+        self._cond = threading.Condition()
+        self._metrics = {
+            'created': 0,
+            'closed': 0,
+            'borrows': 0,
+            'waits': 0,
+            'wait_seconds_total': 0.0,
+            'max_wait_seconds': 0.0,
+            'timeouts': 0,
+            'health_check_failures': 0,
+            'peak_in_use': 0,
+        }
+
+    def _close_raw(self, raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+        self._metrics['closed'] += 1
+
+    def _expire_idle(self):
+        """
+        유휴 시간이 지난 연결을 min_size를 넘는 만큼 닫습니다. (lock 안에서 호출)
+        """
+        now = time.monotonic()
+        while self._idle and len(self._idle) + self._in_use > self.min_size \
+                and now - self._idle[0][1] > self.idle_timeout:
+            raw, _ = self._idle.popleft()
+            self._close_raw(raw)
+
+    def _take(self) -> Optional[pymysql.connections.Connection]:
+        """
+        유휴 연결 하나를 꺼내거나, 새로 만들 수 있으면 None을 반환합니다. (lock 안에서 호출)
+        새로 만들 자리도 없으면 반납될 때까지 기다립니다.
+        """
+        self._expire_idle()
+        start = None
+        while True:
+            if self._idle:
+                return self._idle.pop()[0]  # 가장 최근에 반납된 연결 (살아 있을 가능성이 높음)
+            if self._in_use < self.max_size:
+                return None
+            if start is None:
+                start = time.monotonic()
+                self._metrics['waits'] += 1
+            remaining = self.borrow_timeout - (time.monotonic() - start)
+            if remaining <= 0:
+                self._metrics['timeouts'] += 1
+                raise PoolTimeoutError(f"DB 연결 대기 시간 초과 ({self.borrow_timeout}s, 최대 {self.max_size}개 사용 중)")
+            self._cond.wait(remaining)
+
+    def acquire(self, shared: bool = False) -> PooledConnection:
+        wait_start = time.monotonic()
+        with self._cond:
+            raw = self._take()
+            self._in_use += 1
+            self._metrics['borrows'] += 1
+            self._metrics['peak_in_use'] = max(self._metrics['peak_in_use'], self._in_use)
+            waited = time.monotonic() - wait_start
+            self._metrics['wait_seconds_total'] += waited
+            self._metrics['max_wait_seconds'] = max(self._metrics['max_wait_seconds'], waited)
+
+        # 연결 생성과 상태 확인은 lock 밖에서 수행
+        try:
+            if raw is not None:
+                try:
+                    raw.ping(reconnect=False)
+                except Exception:
+                    with self._cond:
+                        self._metrics['health_check_failures'] += 1
+                        self._close_raw(raw)
+                    raw = None
+            if raw is None:
+                raw = connect()
+                with self._cond:
+                    self._metrics['created'] += 1
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        return PooledConnection(self, raw, shared)
+
+    def release(self, raw: pymysql.connections.Connection):
+        # 끝내지 않은 트랜잭션은 되돌린 뒤 반납
+        try:
+            if raw.open and raw.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+                raw.rollback()
+            reusable = raw.open
+        except Exception:
+            reusable = False
+
+        with self._cond:
+            self._in_use -= 1
+            if reusable:
+                self._idle.append((raw, time.monotonic()))
+            else:
+                self._close_raw(raw)
+            self._expire_idle()
+            self._cond.notify()
+
+    def close_all(self):
+        with self._cond:
+            while self._idle:
+                self._close_raw(self._idle.popleft()[0])
+
+    def metrics(self) -> Dict:
+        with self._cond:
+            metrics = dict(self._metrics)
+            metrics.update({
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'saturation': self._in_use / self.max_size,
+                'avg_wait_seconds': metrics['wait_seconds_total'] / metrics['borrows'] if metrics['borrows'] else 0.0,
+            })
+        return metrics
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """
+    프로세스별 연결 풀. fork된 자식 프로세스는 부모의 연결을 쓰지 않고 새 풀을 만듭니다.
+    """
+    global _pool
+    if _pool is None or _pool.pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool.pid != os.getpid():
+                _pool = ConnectionPool(db_pool_min_size, db_pool_max_size, db_pool_idle_timeout, db_pool_borrow_timeout)
+    return _pool
+
+
+def get_db():
+    """
+    Flask 요청(app context) 안에서는 요청마다 풀에서 연결 하나를 빌려 모든 repository가 함께 사용하고,
+    요청이 끝나면 close_db()에서 반납합니다.
+    요청 밖(스크립트, 워커 프로세스)에서는 반납 시점을 알 수 없으므로 풀을 거치지 않는 새 연결을 반환합니다.
+    이 연결은 close()하거나 GC될 때 닫힙니다.
+    """
+    if has_app_context():
+        if 'db' not in g:
+            g.db = get_pool().acquire(shared=True)
+        return g.db
+    return connect()
+
+
+def close_db(e=None):
+    db = g.pop('db', None)
+    if db is not None:
+        db.release()
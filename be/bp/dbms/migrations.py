@@ -0,0 +1,290 @@
+"""
+DB 스키마 생성과 버전별 마이그레이션
+
+repository 생성자에서 매번 CREATE TABLE을 실행하지 않고, 앱 시작 시(또는 CLI로) 한 번만 적용합니다.
+- 적용한 버전은 schema_migrations 테이블에 기록하고, 아직 적용하지 않은 버전만 순서대로 실행
+- 여러 프로세스가 동시에 시작해도 GET_LOCK으로 한 곳에서만 실행
+- MariaDB의 DDL은 자동 커밋되므로 각 문장은 다시 실행해도 안전하게(IF NOT EXISTS) 작성
+
+새 스키마 변경은 migrations 리스트 끝에 다음 버전으로 추가합니다. 이미 적용한 버전은 수정하지 않습니다.
+
+documents, column_table, column_map, table_map, domains, distinct_value 테이블은 포함하지 않습니다.
+해당 repository는 앱에서 사용하지 않는 SQLite용 코드(? 자리표시자, AUTOINCREMENT)로, 생성자의 DDL을 그대로 둡니다.
+
+사용법: python -m bp.dbms.migrations [--status]
+"""
+
+from typing import List, NamedTuple, Tuple
+import argparse
+
+from bp.dbms.mariadb import connect
+from bp.utils.loggers import setup_logger
+
+logger = setup_logger()
+
+migration_lock_name = "docs_parsing_schema_migrations"
+migration_lock_timeout = 60  # 다른 프로세스가 마이그레이션 중이면 기다리는 시간(초)
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    statements: Tuple[str, ...]
+
+
+migrations: List[Migration] = [
+    Migration(1, "initial schema", (
+        """
+        CREATE TABLE IF NOT EXISTS document_tokens (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            value VARCHAR(255) NOT NULL,
+            document_name VARCHAR(255) NOT NULL,
+            col_id INT NOT NULL,
+            word_type VARCHAR(50) NOT NULL,
+            cate1 VARCHAR(100) NOT NULL,
+            cate2 VARCHAR(100) NOT NULL,
+            document_path VARCHAR(255) NOT NULL,
+            pii_type VARCHAR(100),
+            total_cnt INT,
+            domain_cnt INT,
+            cate1_cnt INT,
+            cate2_cnt INT,
+            doc_cnt INT,
+            col_cnt INT,
+            regi_date DATE NOT NULL,
+            gap_avg FLOAT NOT NULL,
+            gap_sd FLOAT NOT NULL,
+            index_list JSON NOT NULL,
+            `index` INT,
+            INDEX idx_value (value(255)),
+            INDEX idx_document_path (document_path(255)),
+            INDEX idx_composite (value(255), document_path(255), col_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS dictionary (
+            word VARCHAR(255),
+            cate1 VARCHAR(100),
+            cate2 VARCHAR(100),
+            importance INTEGER DEFAULT 1,
+            regi_date TEXT,
+            domain TEXT,
+            domain_id TEXT,
+            user_id VARCHAR(100),
+            add_count INTEGER DEFAULT 0,
+            delete_count INTEGER DEFAULT 0,
+            PRIMARY KEY (word, cate1, cate2, user_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS stopwords (
+            word VARCHAR(255),
+            cate1 VARCHAR(100),
+            cate2 VARCHAR(100),
+            regi_date TEXT,
+            domain TEXT,
+            domain_id TEXT,
+            user_id VARCHAR(100),
+            add_count INTEGER DEFAULT 0,
+            delete_count INTEGER DEFAULT 0,
+            PRIMARY KEY (word, cate1, cate2, user_id)
+        )
+        """,
+        # 불용어 변경 버전 (토크나이저가 버전만 확인하고 바뀐 경우에만 불용어를 다시 읽음)
+        """
+        CREATE TABLE IF NOT EXISTS stopwords_meta (
+            id TINYINT PRIMARY KEY,
+            version BIGINT NOT NULL DEFAULT 0
+        )
+        """,
+        "INSERT IGNORE INTO stopwords_meta (id, version) VALUES (1, 0)",
+    )),
+    Migration(2, "word frequency aggregate tables", (
+        """
+        CREATE TABLE IF NOT EXISTS word_totals (
+            value VARCHAR(255) NOT NULL PRIMARY KEY,
+            cnt BIGINT NOT NULL DEFAULT 0
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS word_domain (
+            value VARCHAR(255) NOT NULL,
+            document_name VARCHAR(255) NOT NULL,
+            cnt BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (value, document_name)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS word_cate1 (
+            value VARCHAR(255) NOT NULL,
+            cate1 VARCHAR(100) NOT NULL,
+            cnt BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (value, cate1)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS word_cate2 (
+            value VARCHAR(255) NOT NULL,
+            cate2 VARCHAR(100) NOT NULL,
+            cnt BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (value, cate2)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS word_doc (
+            value VARCHAR(255) NOT NULL,
+            document_path VARCHAR(255) NOT NULL,
+            cnt BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (value, document_path)
+        )
+        """,
+        # 집계 테이블 도입 전에 적재된 document_tokens로 채움 (중간에 실패해 다시 실행해도 같은 값)
+        """
+        INSERT INTO word_totals (value, cnt)
+        SELECT value, SUM(COALESCE(col_cnt, 0)) FROM document_tokens GROUP BY value
+        ON DUPLICATE KEY UPDATE cnt = VALUES(cnt)
+        """,
+        """
+        INSERT INTO word_domain (value, document_name, cnt)
+        SELECT value, document_name, SUM(COALESCE(col_cnt, 0)) FROM document_tokens GROUP BY value, document_name
+        ON DUPLICATE KEY UPDATE cnt = VALUES(cnt)
+        """,
+        """
+        INSERT INTO word_cate1 (value, cate1, cnt)
+        SELECT value, cate1, SUM(COALESCE(col_cnt, 0)) FROM document_tokens GROUP BY value, cate1
+        ON DUPLICATE KEY UPDATE cnt = VALUES(cnt)
+        """,
+        """
+        INSERT INTO word_cate2 (value, cate2, cnt)
+        SELECT value, cate2, SUM(COALESCE(col_cnt, 0)) FROM document_tokens GROUP BY value, cate2
+        ON DUPLICATE KEY UPDATE cnt = VALUES(cnt)
+        """,
+        """
+        INSERT INTO word_doc (value, document_path, cnt)
+        SELECT value, document_path, SUM(COALESCE(col_cnt, 0)) FROM document_tokens GROUP BY value, document_path
+        ON DUPLICATE KEY UPDATE cnt = VALUES(cnt)
+        """,
+    )),
+    Migration(3, "document statistics snapshot", (
+        """
+        CREATE TABLE IF NOT EXISTS document_statistics (
+            document_path VARCHAR(255) NOT NULL PRIMARY KEY,
+            data_version VARCHAR(64) NOT NULL,
+            statistics LONGTEXT NOT NULL,
+            updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        )
+        """,
+    )),
+    Migration(4, "indexes for token queries", (
+        # 문서 토큰 목록 필터 (dictionary_repository.get_document_tokens)
+        "CREATE INDEX IF NOT EXISTS idx_cate ON document_tokens (cate1, cate2)",
+        "CREATE INDEX IF NOT EXISTS idx_word_type ON document_tokens (word_type)",
+        # 문서별 조회를 분할 순서대로 (get_tokens_by_document_path, get_segmented_tokens)
+        "CREATE INDEX IF NOT EXISTS idx_document_path_col ON document_tokens (document_path, col_id)",
+        "DROP INDEX IF EXISTS idx_document_path ON document_tokens",
+        # 목록 정렬 (total_cnt 순)
+        "CREATE INDEX IF NOT EXISTS idx_cnt ON word_totals (cnt)",
+        # 사용자별 불용어/의미사전 조회 (word, user_id)
+        "CREATE INDEX IF NOT EXISTS idx_word_user ON stopwords (word, user_id)",
+        "CREATE INDEX IF NOT EXISTS idx_word_user ON dictionary (word, user_id)",
+    )),
+    Migration(5, "stopwords version triggers", (
+        # 불용어 변경 버전은 repository가 아니라 DB에서 올림 (DB에서 직접 수정/삭제한 경우도 토크나이저가 다시 읽음)
+        # 토크나이저는 단어 목록만 사용하므로 UPDATE는 단어가 바뀐 경우에만 올림 (add_count 등 횟수 변경 제외)
+        """
+        CREATE TRIGGER IF NOT EXISTS stopwords_version_insert AFTER INSERT ON stopwords
+        FOR EACH ROW UPDATE stopwords_meta SET version = version + 1 WHERE id = 1
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS stopwords_version_update AFTER UPDATE ON stopwords
+        FOR EACH ROW UPDATE stopwords_meta SET version = version + 1 WHERE id = 1 AND NOT (NEW.word <=> OLD.word)
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS stopwords_version_delete AFTER DELETE ON stopwords
+        FOR EACH ROW UPDATE stopwords_meta SET version = version + 1 WHERE id = 1
+        """,
+    )),
+]
+
+
+def _create_migrations_table(cursor):
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INT NOT NULL PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+
+
+def _applied_versions(cursor) -> set:
+    cursor.execute("SELECT version FROM schema_migrations")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def run_migrations() -> List[int]:
+    """
+    아직 적용하지 않은 마이그레이션을 버전 순서대로 적용합니다.
+
+    Returns:
+        List[int]: 이번에 적용한 버전
+    """
+    conn = connect()
+    cursor = conn.cursor()
+    applied = []
+    try:
+        cursor.execute("SELECT GET_LOCK(%s, %s)", (migration_lock_name, migration_lock_timeout))
+        if cursor.fetchone()[0] != 1:
+            raise RuntimeError(f"마이그레이션 잠금을 얻지 못했습니다 ({migration_lock_timeout}s)")
+        try:
+            _create_migrations_table(cursor)
+            done = _applied_versions(cursor)
+            for migration in sorted(migrations, key=lambda m: m.version):
+                if migration.version in done:
+                    continue
+                logger.info(f"[migrations.py] {migration.version}: {migration.name} 적용")
+                for statement in migration.statements:
+                    cursor.execute(statement)
+                cursor.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                    (migration.version, migration.name)
+                )
+                conn.commit()
+                applied.append(migration.version)
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (migration_lock_name,))
+    except Exception as e:
+        logger.error(f"[migrations.py] 마이그레이션 실패: {e}")
+        raise
+    finally:
+        conn.close()
+
+    logger.info(f"[migrations.py] 스키마 최신 버전: {max(m.version for m in migrations)}, 이번에 적용: {applied}")
+    return applied
+
+
+def migration_status() -> List[Tuple[int, str, bool]]:
+    """
+    Returns:
+        [(버전, 이름, 적용 여부), ...]
+    """
+    conn = connect()
+    try:
+        cursor = conn.cursor()
+        _create_migrations_table(cursor)
+        done = _applied_versions(cursor)
+    finally:
+        conn.close()
+    return [(m.version, m.name, m.version in done) for m in sorted(migrations, key=lambda m: m.version)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DB 스키마 마이그레이션")
+    parser.add_argument("--status", action="store_true", help="적용하지 않고 버전별 적용 여부만 출력")
+    args = parser.parse_args()
+
+    if args.status:
+        for version, name, is_applied in migration_status():
+            print(f"{version:>4}  {'applied' if is_applied else 'pending':<8} {name}")
+    else:
+        print(f"applied: {run_migrations()}")
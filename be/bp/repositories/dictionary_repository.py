@@ -7,36 +7,23 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 문서 토큰 조회 시 정렬 기준 -> 정렬 컬럼
+document_token_sort_columns = {
+    'value': 't.value',
+    'word': 't.value',
+    'word_type': 't.word_type',
+    'cate1': 't.cate1',
+    'cate2': 't.cate2',
+    'total_cnt': 'wt.cnt',
+    'domain_cnt': 'wd.cnt',
+    'doc_cnt': 'wdoc.cnt',
+}
+
 class DictionaryRepository:
     def __init__(self):
         self.conn = get_db()
         self.cursor = self.conn.cursor()
-            
-        self._create_tables()
 
-    
-    def _create_tables(self):
-        """의미사전 테이블과 사용자 정의 불용어 사전 테이블을 생성합니다."""
-        
-        # 의미사전 테이블 생성
-        self.cursor.execute(
-        """
-            CREATE TABLE IF NOT EXISTS dictionary (
-            word VARCHAR(255),
-            cate1 VARCHAR(100),
-            cate2 VARCHAR(100),
-            importance INTEGER DEFAULT 1,
-            regi_date TEXT,
-            domain TEXT,
-            domain_id TEXT,
-            user_id VARCHAR(100),
-            add_count INTEGER DEFAULT 0,
-            delete_count INTEGER DEFAULT 0,
-            PRIMARY KEY (word, cate1, cate2, user_id)
-            );
-            """
-                            )
-        
     def add_to_dictionary(self, word: str, cate1: str = None, cate2: str = None, increment_count: bool = True, user_id: int = 1) -> Dict:
         """
         의미사전에 단어를 추가합니다.
@@ -376,35 +363,43 @@ class DictionaryRepository:
         """
         try:
             # 기본 쿼리 구성
-            base_query = "FROM document_tokens WHERE 1=1"
+            where_clause = "WHERE 1=1"
             params = []
             
             # 필터 조건 추가
             if word:
-                base_query += " AND value LIKE ?"
+                where_clause += " AND t.value LIKE %s"
                 params.append(f'%{word}%')
             if word_type:
-                base_query += " AND word_type = ?"
+                where_clause += " AND t.word_type = %s"
                 params.append(word_type)
             if cate1:
-                base_query += " AND cate1 = ?"
+                where_clause += " AND t.cate1 = %s"
                 params.append(cate1)
             if cate2:
-                base_query += " AND cate2 = ?"
+                where_clause += " AND t.cate2 = %s"
                 params.append(cate2)
             
             # 총 개수 조회
-            count_query = f"SELECT COUNT(*) {base_query}"
+            count_query = f"SELECT COUNT(*) FROM document_tokens t {where_clause}"
             self.cursor.execute(count_query, params)
             total_count = self.cursor.fetchone()[0]
             
+            # 빈도는 집계 테이블(word_totals, word_domain, word_doc)에서 가져옴
+            sort_column = document_token_sort_columns.get(sort_by, document_token_sort_columns['total_cnt'])
+            sort_direction = 'ASC' if str(sort_order).lower() == 'asc' else 'DESC'
+
             # 정렬 및 페이지네이션 적용
             offset = (page - 1) * per_page
             query = f"""
-                SELECT value, word_type, cate1, cate2, total_cnt, domain_cnt, doc_cnt
-                {base_query}
-                ORDER BY {sort_by} {sort_order}
-                LIMIT ? OFFSET ?
+                SELECT t.value, t.word_type, t.cate1, t.cate2, wt.cnt, wd.cnt, wdoc.cnt
+                FROM document_tokens t
+                LEFT JOIN word_totals wt ON wt.value = t.value
+                LEFT JOIN word_domain wd ON wd.value = t.value AND wd.document_name = t.document_name
+                LEFT JOIN word_doc wdoc ON wdoc.value = t.value AND wdoc.document_path = t.document_path
+                {where_clause}
+                ORDER BY {sort_column} {sort_direction}
+                LIMIT %s OFFSET %s
             """
             params.extend([per_page, offset])
             
@@ -0,0 +1,59 @@
+import json
+from typing import Dict, Optional, Tuple
+
+from bp.dbms import get_db
+from bp.utils.loggers import setup_logger
+
+logger = setup_logger()
+
+class DocumentStatisticsRepository:
+    """
+    문서 통계 스냅샷 저장소
+
+    문서(document_path)마다 적재 시점에 계산한 통계를 JSON으로 저장하고,
+    계산에 사용한 토큰 데이터 버전(data_version)을 함께 기록합니다. (스키마는 bp/dbms/migrations.py)
+    """
+    def __init__(self):
+        try:
+            self.conn = get_db()
+            self.cursor = self.conn.cursor()
+        except Exception as e:
+            logger.error(f"[DB 연결 오류] {e}")
+            raise
+
+    def get_snapshot(self, document_path: str) -> Optional[Tuple[str, Dict]]:
+        """
+        Returns:
+            (data_version, 통계) 또는 스냅샷이 없으면 None
+        """
+        try:
+            self.cursor.execute(
+                "SELECT data_version, statistics FROM document_statistics WHERE document_path = %s",
+                (document_path.replace("\\", "/"),)
+            )
+            row = self.cursor.fetchone()
+            if row is None:
+                return None
+            return row[0], json.loads(row[1])
+        except Exception as e:
+            logger.error(f"[데이터 조회 오류] {e}")
+            raise
+
+    def save_snapshot(self, document_path: str, data_version: str, statistics: Dict):
+        try:
+            self.cursor.execute(
+                """
+                INSERT INTO document_statistics (document_path, data_version, statistics)
+                VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE data_version = VALUES(data_version), statistics = VALUES(statistics)
+                """,
+                (document_path.replace("\\", "/"), data_version, json.dumps(statistics, ensure_ascii=False))
+            )
+            self.conn.commit()
+        except Exception as e:
+            logger.error(f"[데이터 삽입 오류] {e}")
+            self.conn.rollback()
+            raise
+
+    def close(self):
+        self.conn.close()
@@ -1,160 +1,305 @@
 import json
+from collections import Counter
 from typing import List
 import datetime
+import os
+import tempfile
+import time
+
+import pymysql
 
 from bp.views.document_token import DocumentToken
 from bp.dbms import get_db  
 from bp.utils.loggers import setup_logger
+from config import bulk_insert_mode, bulk_insert_max_bytes, bulk_insert_max_rows
 
 logger = setup_logger()
 
+# 단어 빈도 집계 테이블 (스키마는 bp/dbms/migrations.py)
+# - word_totals: 단어별 전체 등장 횟수 (total_cnt)
+# - (집계 테이블, 단어와 함께 묶는 document_tokens 컬럼): domain_cnt, cate1_cnt, cate2_cnt, doc_cnt
+frequency_scope_tables = [
+    ("word_domain", "document_name"),
+    ("word_cate1", "cate1"),
+    ("word_cate2", "cate2"),
+    ("word_doc", "document_path"),
+]
+
+# 조회 시 빈도 컬럼은 행에 저장된 값 대신 집계 테이블에서 가져옴
+token_select_query = """
+SELECT t.id, t.value, t.document_name, t.col_id, t.word_type, t.cate1, t.cate2, t.document_path, t.pii_type,
+    wt.cnt AS total_cnt, wd.cnt AS domain_cnt, w1.cnt AS cate1_cnt, w2.cnt AS cate2_cnt, wdoc.cnt AS doc_cnt,
+    t.col_cnt, t.regi_date, t.gap_avg, t.gap_sd, t.index_list, t.`index`
+FROM document_tokens t
+LEFT JOIN word_totals wt ON wt.value = t.value
+LEFT JOIN word_domain wd ON wd.value = t.value AND wd.document_name = t.document_name
+LEFT JOIN word_cate1 w1 ON w1.value = t.value AND w1.cate1 = t.cate1
+LEFT JOIN word_cate2 w2 ON w2.value = t.value AND w2.cate2 = t.cate2
+LEFT JOIN word_doc wdoc ON wdoc.value = t.value AND wdoc.document_path = t.document_path
+"""
+
+# 적재하는 document_tokens 컬럼 (_token_row의 값 순서)
+token_columns = (
+    "value", "document_name", "col_id", "word_type",
+    "cate1", "cate2", "document_path", "pii_type",
+    "total_cnt", "domain_cnt", "cate1_cnt", "cate2_cnt",
+    "doc_cnt", "col_cnt", "regi_date", "gap_avg", "gap_sd",
+    "index_list", "`index`",
+)
+
+
+def _token_row(token: DocumentToken) -> tuple:
+    return (
+        token.value,
+        token.document_name,
+        token.col_id,
+        token.word_type,
+        token.cate1,
+        token.cate2,
+        token.document_path.replace("\\", "/"),
+        token.pii_type,
+
+        token.total_cnt,
+        token.domain_cnt,
+        token.cate1_cnt,
+        token.cate2_cnt,
+        token.doc_cnt,
+        token.col_cnt,
+
+        token.regi_date,
+        token.gap_avg,
+        token.gap_sd,
+        "[" + ",".join(map(str, token.index_list)) + "]",  # List[int] → JSON 문자열 (json.dumps보다 빠름)
+        token.index
+    )
+
+
+_tsv_escape = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _tsv_field(value) -> str:
+    """
+    LOAD DATA 기본 형식의 필드 (NULL은 \\N, 구분자/줄바꿈/역슬래시는 역슬래시로 escape)
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return str(value).translate(_tsv_escape)
+
+
 class DocumentTokenRepository:
     def __init__(self):
         # 루트 DB에 먼저 접속해서 새 DB 생성
         try:
             self.conn = get_db()
             self.cursor = self.conn.cursor()
-            
-            self._create_table_if_not_exists()
         except Exception as e:
             logger.error(f"[DB 연결 오류] {e}")
             raise
 
-    def _create_table_if_not_exists(self):
-        create_table_query = """
-        CREATE TABLE IF NOT EXISTS document_tokens (
-    id INT AUTO_INCREMENT PRIMARY KEY,
-
-    value VARCHAR(255) NOT NULL,
-    document_name VARCHAR(255) NOT NULL,
-    col_id INT NOT NULL,
-    word_type VARCHAR(50) NOT NULL,
-    cate1 VARCHAR(100) NOT NULL,
-    cate2 VARCHAR(100) NOT NULL,
-    document_path VARCHAR(255) NOT NULL,  -- 수정됨
-    pii_type VARCHAR(100),
+    def _upsert_word_frequencies(self, document_paths: List[str], first_id: int):
+        """
+        방금 적재한 행(id >= first_id)만 GROUP BY로 집계해 빈도 집계 테이블에 더합니다. (커밋은 호출한 쪽에서)
+        비용은 적재한 문서의 행 수에만 비례하고, 기존 document_tokens 행은 고치지 않습니다.
+        """
+        placeholders = ", ".join(["%s"] * len(document_paths))
+        params = [*document_paths, first_id]
+        self.cursor.execute(f"""
+        INSERT INTO word_totals (value, cnt)
+        SELECT value, SUM(COALESCE(col_cnt, 0)) AS delta FROM document_tokens
+        WHERE document_path IN ({placeholders}) AND id >= %s GROUP BY value
+        ON DUPLICATE KEY UPDATE cnt = cnt + VALUES(cnt)
+        """, params)
+        for table, column in frequency_scope_tables:
+            self.cursor.execute(f"""
+            INSERT INTO {table} (value, {column}, cnt)
+            SELECT value, {column}, SUM(COALESCE(col_cnt, 0)) AS delta FROM document_tokens
+            WHERE document_path IN ({placeholders}) AND id >= %s GROUP BY value, {column}
+            ON DUPLICATE KEY UPDATE cnt = cnt + VALUES(cnt)
+            """, params)
+
+    def _upsert_row_frequencies(self, rows: List[tuple]):
+        """
+        적재한 행 값으로 직접 집계해 빈도 집계 테이블에 더합니다. (커밋은 호출한 쪽에서)
+        LOAD DATA는 적재한 행의 id를 알려 주지 않으므로 id 범위 대신 적재한 행 자체로 집계합니다.
+        """
+        value_at = token_columns.index("value")
+        count_at = token_columns.index("col_cnt")
+        totals = Counter()
+        for row in rows:
+            totals[row[value_at]] += row[count_at] or 0
+        self.cursor.executemany(
+            "INSERT INTO word_totals (value, cnt) VALUES (%s, %s) ON DUPLICATE KEY UPDATE cnt = cnt + VALUES(cnt)",
+            list(totals.items())
+        )
+        for table, column in frequency_scope_tables:
+            column_at = token_columns.index(column)
+            counts = Counter()
+            for row in rows:
+                counts[(row[value_at], row[column_at])] += row[count_at] or 0
+            self.cursor.executemany(
+                f"INSERT INTO {table} (value, {column}, cnt) VALUES (%s, %s, %s) "
+                f"ON DUPLICATE KEY UPDATE cnt = cnt + VALUES(cnt)",
+                [(value, key, cnt) for (value, key), cnt in counts.items()]
+            )
 
-    total_cnt INT,
-    domain_cnt INT,
-    cate1_cnt INT,
-    cate2_cnt INT,
-    doc_cnt INT,
-    col_cnt INT,
+    def insert_all_document_tokens(self, document_tokens_list: List[DocumentToken]) -> int:
+        """
+        문서의 토큰 테이블 행을 적재하고 빈도 집계 테이블에 반영합니다.
+        config.bulk_insert_mode가 'load_data'이면 LOAD DATA LOCAL INFILE로, 아니면 크기를 제한한 다중 행 INSERT로 적재합니다.
 
-    regi_date DATE NOT NULL,
-    gap_avg FLOAT NOT NULL,
-    gap_sd FLOAT NOT NULL,
+        Returns:
+            int: 적재한 행 수
+        """
+        if not document_tokens_list:
+            return 0
+
+        rows = [_token_row(token) for token in document_tokens_list]
+        document_paths = sorted({row[6] for row in rows})
+        mode = bulk_insert_mode
+        start = time.perf_counter()
+
+        if mode == 'load_data':
+            try:
+                row_count = self._load_data_infile(rows)
+            except pymysql.err.MySQLError as e:
+                # 서버/클라이언트에서 local_infile을 허용하지 않는 경우 등: 롤백된 상태이므로 INSERT로 다시 적재
+                logger.warning(f"[document_token_repository.py] LOAD DATA 적재 실패, 다중 행 INSERT로 적재: {e}")
+                mode = 'insert'
+        if mode != 'load_data':
+            row_count = self._insert_chunks(rows, document_paths)
+
+        elapsed = time.perf_counter() - start
+        logger.info(f"[document_token_repository.py] {row_count}행 적재 ({mode}, {elapsed:.2f}s, "
+                    f"{row_count / elapsed if elapsed > 0 else 0:.0f} rows/s)")
+        return row_count
+
+    def _insert_chunks(self, rows: List[tuple], document_paths: List[str]) -> int:
+        """
+        행을 bulk_insert_max_bytes / bulk_insert_max_rows 이하의 다중 행 INSERT로 나누어 청크마다 커밋합니다.
+        중간에 실패하면 이번에 적재한 행(id >= 첫 청크의 id)을 지우고 예외를 다시 발생시킵니다.
+        """
+        prefix = f"INSERT INTO document_tokens ({', '.join(token_columns)}) VALUES "
+        row_placeholder = "(" + ", ".join(["%s"] * len(token_columns)) + ")"
+        first_id = None
+        row_count = 0
+        try:
+            chunk, chunk_bytes = [], len(prefix)
+            for row in rows:
+                value = self.cursor.mogrify(row_placeholder, row)
+                # max_allowed_packet은 바이트 기준이므로 문자 수가 아니라 UTF-8 인코딩 길이로 계산 (한글은 글자당 3바이트)
+                value_bytes = len(value.encode('utf-8'))
+                if chunk and (chunk_bytes + value_bytes + 1 > bulk_insert_max_bytes or len(chunk) >= bulk_insert_max_rows):
+                    first_id = self._execute_chunk(prefix, chunk, first_id)
+                    row_count += len(chunk)
+                    chunk, chunk_bytes = [], len(prefix)
+                chunk.append(value)
+                chunk_bytes += value_bytes + 1
+            first_id = self._execute_chunk(prefix, chunk, first_id)
+            row_count += len(chunk)
+
+            # 집계 테이블 5개는 한 트랜잭션으로 반영 (autocommit 연결이므로 명시적으로 시작)
+            self.conn.begin()
+            self._upsert_word_frequencies(document_paths, first_id)
+            self.conn.commit()
+            return row_count
 
-    index_list JSON NOT NULL,
-    `index` INT,
+        except Exception as e:
+            logger.error(f"[데이터 삽입 오류] {e}")
+            self.conn.rollback()
+            if first_id is not None:
+                self._delete_loaded_rows(document_paths, first_id)
+            raise
 
-    INDEX idx_value (value(255)),
-    INDEX idx_document_path (document_path(255)),
-    INDEX idx_composite (value(255), document_path(255), col_id)
+    def _execute_chunk(self, prefix: str, chunk: List[str], first_id: int) -> int:
+        self.conn.begin()
+        self.cursor.execute(prefix + ",".join(chunk))
+        chunk_first_id = self.cursor.lastrowid  # 다중 행 INSERT의 첫 행 id
+        self.conn.commit()
+        return chunk_first_id if first_id is None else first_id
 
-);
+    def _delete_loaded_rows(self, document_paths: List[str], first_id: int):
+        placeholders = ", ".join(["%s"] * len(document_paths))
+        try:
+            self.cursor.execute(
+                f"DELETE FROM document_tokens WHERE document_path IN ({placeholders}) AND id >= %s",
+                [*document_paths, first_id]
+            )
+            self.conn.commit()
+        except Exception as e:
+            logger.error(f"[document_token_repository.py] 적재 실패한 행 삭제 오류: {e}")
 
+    def _load_data_infile(self, rows: List[tuple]) -> int:
         """
-        self.cursor.execute(create_table_query)
-    
-
-    def insert_all_document_tokens(self, document_tokens_list: List[DocumentToken]) -> tuple[int, List[str]]:
-        try: 
-            query = """
-            INSERT INTO document_tokens (
-                value, document_name, col_id, word_type,
-                cate1, cate2, document_path, pii_type,
-                total_cnt, domain_cnt, cate1_cnt, cate2_cnt,
-                doc_cnt, col_cnt, regi_date, gap_avg, gap_sd,
-                index_list, `index`
-            ) VALUES (
-                %s, %s, %s, %s,
-                %s, %s, %s, %s,
-                %s, %s, %s, %s,
-                %s, %s, %s, %s, %s,
-                %s, %s
+        행을 임시 TSV 파일에 쓰고 LOAD DATA LOCAL INFILE 한 번으로 적재합니다. (한 트랜잭션, 실패 시 롤백)
+        서버의 local_infile이 켜져 있어야 합니다.
+        """
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='\n', suffix='.tsv', delete=False) as f:
+            tsv_path = f.name
+            for row in rows:
+                f.write("\t".join(_tsv_field(value) for value in row))
+                f.write("\n")
+        try:
+            self.conn.begin()
+            self.cursor.execute(
+                f"""
+                LOAD DATA LOCAL INFILE %s INTO TABLE document_tokens
+                CHARACTER SET utf8mb4
+                FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+                LINES TERMINATED BY '\\n'
+                ({', '.join(token_columns)})
+                """,
+                (tsv_path,)
             )
-            """
-            values = [
-                (
-                    token.value,
-                    token.document_name,
-                    token.col_id,  # List[int] → JSON 문자열
-                    token.word_type,
-                    token.cate1,
-                    token.cate2,
-                    token.document_path.replace("\\", "/"),
-                    token.pii_type,
-
-                    token.total_cnt,
-                    token.domain_cnt,
-                    token.cate1_cnt,
-                    token.cate2_cnt,
-                    token.doc_cnt,
-                    token.col_cnt,
-
-                    token.regi_date,
-                    token.gap_avg,
-                    token.gap_sd,
-                    json.dumps(token.index_list),  # List[int] → JSON 문자열
-                    token.index
-                )
-                for token in document_tokens_list
-            ]
-
-            self.cursor.executemany(query, values)
+            row_count = self.cursor.rowcount
+            self._upsert_row_frequencies(rows)
             self.conn.commit()
-            row_count = self.cursor.rowcount 
-
             return row_count
-        
         except Exception as e:
             logger.error(f"[데이터 삽입 오류] {e}")
             self.conn.rollback()
             raise
+        finally:
+            os.remove(tsv_path)
 
         
-    def update_token_counts(self, updated_tokens: List[DocumentToken]):
-        query = """
-        UPDATE document_tokens
-        SET 
-            total_cnt = %s,
-            domain_cnt = %s,
-            cate1_cnt = %s,
-            cate2_cnt = %s,
-            doc_cnt = %s
-        WHERE 
-            value = %s AND
-            document_name = %s AND
-            col_id = %s
+    def delete_token_by_id(self, token_id: int) -> int:
         """
-        
-        values = [
-            (
-                token.total_cnt,
-                token.domain_cnt,
-                token.cate1_cnt,
-                token.cate2_cnt,
-                token.doc_cnt,
-                token.value,
-                token.document_name,
-                token.col_id
-            )
-            for token in updated_tokens
-        ]
-
-        self.cursor.executemany(query, values)
-        self.conn.commit()
-        return self.cursor.rowcount 
-
-    def delete_token_by_id(self, token_id: int):
-        query = "DELETE FROM document_tokens WHERE id = %s"
-        self.cursor.execute(query, (token_id,))
-        self.conn.commit()
-
-        return self.cursor.rowcount
+        토큰 행을 지우고, 같은 트랜잭션에서 빈도 집계 테이블 5개에서도 그 행의 빈도(col_cnt)를 뺍니다.
 
+        Returns:
+            int: 삭제한 행 수 (없는 id이면 0)
+        """
+        scope_columns = [column for _, column in frequency_scope_tables]
+        try:
+            self.conn.begin()
+            self.cursor.execute(
+                f"SELECT value, {', '.join(scope_columns)}, COALESCE(col_cnt, 0) FROM document_tokens "
+                f"WHERE id = %s FOR UPDATE",
+                (token_id,)
+            )
+            row = self.cursor.fetchone()
+            if row is None:
+                self.conn.rollback()
+                return 0
+            value, *scope_values, col_cnt = row
+
+            self.cursor.execute("DELETE FROM document_tokens WHERE id = %s", (token_id,))
+            deleted = self.cursor.rowcount
+            self.cursor.execute("UPDATE word_totals SET cnt = cnt - %s WHERE value = %s", (col_cnt, value))
+            for (table, column), scope_value in zip(frequency_scope_tables, scope_values):
+                self.cursor.execute(
+                    f"UPDATE {table} SET cnt = cnt - %s WHERE value = %s AND {column} = %s",
+                    (col_cnt, value, scope_value)
+                )
+            self.conn.commit()
+            return deleted
 
+        except Exception as e:
+            logger.error(f"[토큰 삭제 오류] {e}")
+            self.conn.rollback()
+            raise
 
     def get_tokens_by_document_path(self, document_path: str) -> List[DocumentToken]:
         """
@@ -167,8 +312,8 @@ class DocumentTokenRepository:
             List[DocumentToken]: 조회된 DocumentToken 객체 리스트.
         """
         try:
-            document_path = document_path.replace('\\', '\\\\')
-            query = "SELECT * FROM document_tokens WHERE document_path = %s"
+            document_path = document_path.replace("\\", "/")  # 적재 시와 같은 경로 표기
+            query = token_select_query + "WHERE t.document_path = %s"
             self.cursor.execute(query, (document_path,))
             rows = self.cursor.fetchall()
 
@@ -205,7 +350,7 @@ class DocumentTokenRepository:
         """
         try:
             logger.info(f"word: {word}, document_path: {document_path}, seg_id: {seg_id}")
-            query = "SELECT * FROM document_tokens WHERE value = %s AND document_path = %s AND col_id = %s"
+            query = token_select_query + "WHERE t.value = %s AND t.document_path = %s AND t.col_id = %s"
             self.cursor.execute(query, (word, document_path, seg_id))
             rows = self.cursor.fetchall()
 
@@ -238,7 +383,7 @@ class DocumentTokenRepository:
             List[DocumentToken]: 조회된 DocumentToken 객체 리스트.
         """
         try:
-            query = "SELECT * FROM document_tokens"
+            query = token_select_query
             self.cursor.execute(query)
             rows = self.cursor.fetchall()
 
@@ -262,6 +407,21 @@ class DocumentTokenRepository:
             logger.error(f"[데이터 조회 오류] {e}")
             raise
 
+    def get_document_data_version(self, document_path: str) -> str:
+        """
+        문서 토큰의 데이터 버전 ("행 수:최대 id")
+        토큰이 추가/삭제되거나 문서를 다시 적재하면 값이 바뀝니다.
+        """
+        try:
+            query = "SELECT COUNT(*), COALESCE(MAX(id), 0) FROM document_tokens WHERE document_path = %s"
+            self.cursor.execute(query, (document_path.replace("\\", "/"),))
+            row_count, max_id = self.cursor.fetchone()
+            return f"{row_count}:{max_id}"
+
+        except Exception as e:
+            logger.error(f"[데이터 조회 오류] {e}")
+            raise
+
     def close(self):
         self.conn.close()  # 명시적으로 닫는 메서드 정의
 if __name__=="__main__":
@@ -289,8 +449,5 @@ if __name__=="__main__":
     print(r_c,document_name)
     breakpoint()
     document_token_repository.close()  # 연결 닫기!
-    # document_token_list_updated = [DocumentToken(value='Google', document_name='AGI', col_id=1, word_type='alphabet', cate1='기술', cate2='AI', document_path='D:/2025/parsing', pii_type=None, total_cnt=3, domain_cnt=3, cate1_cnt=3, cate2_cnt=3, doc_cnt=3, col_cnt=1, regi_date=datetime.date(2025, 3, 26), gap_avg=0.0, gap_sd=0.0, index_list=[0], index=0), DocumentToken(value='AI', document_name='AGI', col_id=1, word_type='alphabet', cate1='기술', cate2='AI', document_path='D:/2025/parsing', pii_type=None, total_cnt=2, domain_cnt=2, cate1_cnt=2, cate2_cnt=2, doc_cnt=2, col_cnt=1, regi_date=datetime.date(2025, 3, 26), gap_avg=0.0, gap_sd=0.0, index_list=[1], index=1), DocumentToken(value='분야', document_name='AGI', col_id=1, word_type='noun', cate1='기술', cate2='AI', document_path='D:/2025/parsing', pii_type=None, total_cnt=2, domain_cnt=2, cate1_cnt=2, cate2_cnt=2, doc_cnt=2, col_cnt=1, regi_date=datetime.date(2025, 3, 26), gap_avg=0.0, gap_sd=0.0, index_list=[2], index=2), DocumentToken(value='선도', document_name='AGI', col_id=1, word_type='noun', cate1='기술', cate2='AI', document_path='D:/2025/parsing', pii_type=None, total_cnt=6, domain_cnt=6, cate1_cnt=6, cate2_cnt=6, doc_cnt=6, col_cnt=3, regi_date=datetime.date(2025, 3, 26), gap_avg=2.0, gap_sd=0.0, index_list=[3, 5, 7], index=7), DocumentToken(value='있', document_name='AGI', col_id=1, word_type='adjective', cate1='기술', cate2='AI', document_path='D:/2025/parsing', pii_type=None, total_cnt=3, domain_cnt=3, cate1_cnt=3, cate2_cnt=3, doc_cnt=3, col_cnt=1, regi_date=datetime.date(2025, 3, 26), gap_avg=0.0, gap_sd=0.0, index_list=[8], index=8), DocumentToken(value='Google', document_name='AGI', col_id=2, word_type='alphabet', cate1='기술', cate2='AI', document_path='D:/2025/parsing', pii_type=None, total_cnt=3, domain_cnt=3, cate1_cnt=3, cate2_cnt=3, doc_cnt=3, col_cnt=1, regi_date=datetime.date(2025, 3, 26), gap_avg=0.0, gap_sd=0.0, index_list=[10], index=10), DocumentToken(value='AI', document_name='AGI', col_id=2, word_type='alphabet', cate1='기술', cate2='AI', document_path='D:/2025/parsing', pii_type=None, total_cnt=2, domain_cnt=2, cate1_cnt=2, cate2_cnt=2, doc_cnt=2, col_cnt=1, regi_date=datetime.date(2025, 3, 26), gap_avg=0.0, gap_sd=0.0, index_list=[11], index=11), DocumentToken(value='분야', document_name='AGI', col_id=2, word_type='noun', cate1='기술', cate2='AI', document_path='D:/2025/parsing', pii_type=None, total_cnt=2, domain_cnt=2, cate1_cnt=2, cate2_cnt=2, doc_cnt=2, col_cnt=1, regi_date=datetime.date(2025, 3, 26), gap_avg=0.0, gap_sd=0.0, index_list=[12], index=12), DocumentToken(value='선도', document_name='AGI', col_id=2, word_type='noun', cate1='기술', cate2='AI', document_path='D:/2025/parsing', pii_type=None, total_cnt=6, domain_cnt=6, cate1_cnt=6, cate2_cnt=6, doc_cnt=6, col_cnt=2, regi_date=datetime.date(2025, 3, 26), gap_avg=4.0, gap_sd=0.0, index_list=[13, 17], index=17), DocumentToken(value='있', document_name='AGI', col_id=2, word_type='adjective', cate1='기술', cate2='AI', document_path='D:/2025/parsing', pii_type=None, total_cnt=3, domain_cnt=3, cate1_cnt=3, cate2_cnt=3, doc_cnt=3, col_cnt=1, regi_date=datetime.date(2025, 3, 26), gap_avg=0.0, gap_sd=0.0, index_list=[18], index=18), DocumentToken(value='Google', document_name='AGI', col_id=3, word_type='alphabet', cate1='기술', cate2='AI', document_path='D:/2025/parsing', pii_type=None, total_cnt=3, domain_cnt=3, cate1_cnt=3, cate2_cnt=3, doc_cnt=3, col_cnt=1, regi_date=datetime.date(2025, 3, 26), gap_avg=0.0, gap_sd=0.0, index_list=[20], index=20), DocumentToken(value='선도', document_name='AGI', col_id=3, word_type='noun', cate1='기술', cate2='AI', document_path='D:/2025/parsing', pii_type=None, total_cnt=6, domain_cnt=6, cate1_cnt=6, cate2_cnt=6, doc_cnt=6, col_cnt=1, regi_date=datetime.date(2025, 3, 26), gap_avg=0.0, gap_sd=0.0, index_list=[23], index=23), DocumentToken(value='있', document_name='AGI', col_id=3, word_type='adjective', cate1='기술', cate2='AI', document_path='D:/2025/parsing', pii_type=None, total_cnt=3, domain_cnt=3, cate1_cnt=3, cate2_cnt=3, doc_cnt=3, col_cnt=1, regi_date=datetime.date(2025, 3, 26), gap_avg=0.0, gap_sd=0.0, index_list=[28], index=28)]
-    
-    # print(document_token_repository.update_token_counts(document_token_list_updated))
     
     # print(document_token_repository.select_all_tokens())
\ No newline at end of file
@@ -8,33 +8,11 @@ import logging
 logger = logging.getLogger(__name__)
 
 class StopwordsRepository:
-    def __init__(self):        
-        self.conn = get_db()
+    def __init__(self, conn=None):
+        # conn: 오래 유지하는 전용 연결을 쓰는 경우에만 지정 (기본은 연결 풀)
+        self.conn = conn if conn is not None else get_db()
         self.cursor = self.conn.cursor()
 
-        self._create_tables()
-
-    def _create_tables(self):
-        """사용자 정의 불용어 사전 테이블을 생성합니다."""
-        
-        # 사용자 정의 불용어 사전 테이블 생성
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS stopwords (
-                word VARCHAR(255),
-                cate1 VARCHAR(100),
-                cate2 VARCHAR(100),
-                regi_date TEXT,
-                domain TEXT,
-                domain_id TEXT,
-                user_id VARCHAR(100),
-                add_count INTEGER DEFAULT 0,
-                delete_count INTEGER DEFAULT 0,
-                PRIMARY KEY (word, cate1, cate2, user_id)
-            );
-        """
-        )
-
     def add_to_stopwords(self, word: str, cate1: str = None, cate2: str = None, increment_count: bool = True, user_id: int = 1) -> Dict:
         """
         불용어사전에 단어를 추가합니다.
@@ -296,4 +274,37 @@ class StopwordsRepository:
             print(f"불용어 목록 조회 중 오류 발생: {e}")
             return []
         finally:
-            self.conn.close() 
\ No newline at end of file
+            self.conn.close()
+
+    def get_stopwords_version(self) -> int:
+        """
+        불용어 변경 버전을 가져옵니다. (전체 목록을 읽지 않고 변경 여부만 확인할 때 사용)
+        버전은 stopwords 테이블의 트리거가 단어 추가/변경/삭제 시 올립니다. (bp/dbms/migrations.py)
+        연결을 닫지 않으므로 같은 repository로 반복 호출할 수 있습니다.
+
+        Returns:
+            불용어 변경 버전
+        """
+        try:
+            self.conn.ping(reconnect=True)
+            self.cursor.execute("SELECT version FROM stopwords_meta WHERE id = 1")
+            row = self.cursor.fetchone()
+            return row[0] if row else 0
+        except Exception as e:
+            logger.error(f"불용어 버전 조회 중 오류 발생: {e}")
+            raise
+
+    def get_stopword_words(self) -> List[str]:
+        """
+        모든 불용어 목록을 가져옵니다. get_all_stopwords와 달리 연결을 닫지 않습니다.
+
+        Returns:
+            불용어 목록 (중복 제거)
+        """
+        try:
+            self.conn.ping(reconnect=True)
+            self.cursor.execute("SELECT DISTINCT word FROM stopwords WHERE word IS NOT NULL")
+            return [row[0] for row in self.cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"불용어 목록 조회 중 오류 발생: {e}")
+            raise
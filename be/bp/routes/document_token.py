@@ -55,16 +55,24 @@ def upload_files_and_make_token_tables():
         all_word_counts = 0
         total_file_path_lists = []
         all_documents = []
+        all_failed_documents = []
         
+        # 메타데이터 행마다 서비스(와 repository)를 새로 만들지 않고 요청 안에서 재사용
+        document_parsing_service = DocumentParsingService()
         for meta in metadata:
-            document_parsing_service = DocumentParsingService()
+            failed_before = len(document_parsing_service.failed_documents)
             document_counts, word_counts, file_path_lists = document_parsing_service.create_document_token(lang, meta)
             all_document_counts += document_counts
             all_word_counts += word_counts
             total_file_path_lists.extend(file_path_lists)
+            failed_documents = document_parsing_service.failed_documents[failed_before:]
+            all_failed_documents.extend(failed_documents)
+            failed_paths = {failed['file_path'] for failed in failed_documents}
             
             # 각 파일에 대한 문서 정보 가져오기
             for file_path in file_path_lists:
+                if file_path in failed_paths:
+                    continue
                 try:
                     document = document_parsing_service.get_segmented_tokens(file_path)
                     all_documents.append({
@@ -80,6 +88,7 @@ def upload_files_and_make_token_tables():
             'word_counts': all_word_counts,
             'total_file_path_lists': total_file_path_lists,
             'documents': all_documents,
+            'failed_documents': all_failed_documents,
             'message': '엑셀 파일 처리 완료'
         }), 200
     
@@ -524,7 +533,7 @@ def get_document_tokens():
 @bp.route('/document/statistics', methods=['POST'])
 def get_document_statistics():
     """
-    문서의 통계 정보를 계산하고 반환합니다.
+    적재 시 저장한 문서 통계 스냅샷을 반환합니다. (토큰이 바뀐 경우에만 다시 계산)
     """
     try:
         data = request.get_json()
@@ -1,81 +1,176 @@
 from collections import defaultdict
-from typing import List
+from typing import Dict, List, Union, Iterable, Iterator, Tuple, Optional
 from datetime import date
 
 import numpy as np
+import pandas as pd
 
 from bp.views.tokens import SegmentTokens, Token
 from bp.views.document_token import DocumentToken
+from bp.services.document_token.token_buffer import TokenBuffer
 from bp.utils.loggers import setup_logger
 
 logger = setup_logger()
 
+def _iter_token_rows(parsed_segments: Union[TokenBuffer, List[List[SegmentTokens]]]) -> Iterator[Tuple[str, str, Optional[str], int, int]]:
+    """
+    (단어, 태그, 개인정보 유형, 인덱스, 분할 id)를 토큰 순서대로 내보냅니다.
+    """
+    if isinstance(parsed_segments, TokenBuffer):
+        yield from parsed_segments.iter_rows()
+        return
+
+    for segment in parsed_segments:
+        for seg in segment:
+            for token in seg.segment_tokens:
+                yield token.word, token.tag, token.pii_type, token.idx, token.seg_id
+
+
 def compute_token_stats_by_word(
-    parsed_segments: List[SegmentTokens],
+    parsed_segments: Union[TokenBuffer, List[List[SegmentTokens]]],
     document_name: str,
     document_path: str,
     cate1: str,
     cate2: str
 ) -> List[DocumentToken]:
     logger.info(f"[analysis_document.py] 문서 내 토큰 테이블 생성 중")
-    word_map = defaultdict(lambda: {
-            "value": "",
-            "word_type": "",
-            "document_name": document_name,
-            "document_path": document_path,
-            "cate1": cate1,
-            "cate2": cate2,
-            "pii_type": None,
-            "regi_date": date.today(),
-            "index_list": [],
-            "index": 0
-        })
-
-
-    # 1. 단어별 정보 수집
-    for segment in parsed_segments:
-        for seg in segment:
-            for token in seg.segment_tokens:
+    results = _build_document_tokens(parsed_segments, document_name, document_path, cate1, cate2)
+    logger.info(f"[analysis_document.py] 총 {len(results)}개의 문서 내 토큰 테이블 행 생성")
+
+    return results
+
 
-                word = token.word
-                tag = token.tag
-                seg_id = token.seg_id
-                idx = token.idx
-                pii_type = token.pii_type
-
-                entry = word_map[(word, seg_id)]
-                entry["value"] = word
-                entry["word_type"] = tag
-                entry["pii_type"] = pii_type
-                entry["index_list"].append(idx)
-                entry["index"] = idx
-                
-            
-    # 2. 통계 계산 및 모델 생성
+def compute_token_stats_streaming(
+    segment_buffers: Iterable[TokenBuffer],
+    document_name: str,
+    document_path: str,
+    cate1: str,
+    cate2: str
+) -> List[DocumentToken]:
+    """
+    분할별 TokenBuffer를 받는 대로 집계합니다.
+    집계 키 (단어, 분할 id)는 한 분할 안에서만 나오므로 분할마다 바로 행을 완성하고 버퍼는 버립니다.
+    결과는 문서 전체를 한 번에 넣은 compute_token_stats_by_word와 같습니다.
+    """
+    logger.info("[analysis_document.py] 문서 내 토큰 테이블 생성 중 (분할 단위)")
     results = []
-    for (word, seg_id), info in word_map.items():
-        sorted_indices = sorted(info["index_list"])
-        gap_values = [j - i for i, j in zip(sorted_indices[:-1], sorted_indices[1:])]
-        gap_avg = float(np.mean(gap_values)) if gap_values else 0.0
-        gap_sd = float(np.std(gap_values)) if len(gap_values) > 1 else 0.0
+    for buffer in segment_buffers:
+        results.extend(_build_document_tokens(buffer, document_name, document_path, cate1, cate2))
+    logger.info(f"[analysis_document.py] 총 {len(results)}개의 문서 내 토큰 테이블 행 생성")
+
+    return results
+
+
+# 간격이 이 개수 미만인 그룹은 bincount로 표준편차를 계산 (np.std와 같은 순서로 더하므로 결과가 비트 단위로 같음)
+# 그 이상인 그룹은 np.std가 pairwise 합산을 사용하므로 그룹별로 np.std를 호출
+_small_group_gaps = 8
+
+
+def _token_columns(parsed_segments: Union[TokenBuffer, List[List[SegmentTokens]]]) -> TokenBuffer:
+    if isinstance(parsed_segments, TokenBuffer):
+        return parsed_segments
+
+    buffer = TokenBuffer("")
+    for word, tag, pii_type, idx, seg_id in _iter_token_rows(parsed_segments):
+        buffer.append(word, tag, pii_type, idx, seg_id)
+    return buffer
+
+
+def _group_gap_stats(word_ids: np.ndarray, seg_ids: np.ndarray, indices: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    (단어, 분할 id) 그룹별 인덱스 간격의 평균/표준편차를 한 번에 계산합니다.
+
+    1. (단어, 분할 id, 인덱스) 순으로 lexsort
+    2. 정렬된 인덱스의 np.diff 중 같은 그룹 안의 값만 간격으로 사용
+    3. bincount로 그룹별 합계를 구해 평균, 편차 제곱합을 계산
+
+    Returns:
+        order: 정렬 순서 (원래 토큰 위치)
+        group_starts, counts: 정렬 결과에서 그룹별 시작 위치와 토큰 수
+        gap_avg, gap_sd: 그룹별 간격 평균/표준편차
+        first_pos, last_pos: 그룹별 처음/마지막 토큰의 원래 위치
+    """
+    n = len(indices)
+    order = np.lexsort((indices, seg_ids, word_ids))
+    sorted_words = word_ids[order]
+    sorted_segs = seg_ids[order]
+    sorted_indices = indices[order]
+
+    boundary = (sorted_words[1:] != sorted_words[:-1]) | (sorted_segs[1:] != sorted_segs[:-1])
+    group_starts = np.flatnonzero(np.concatenate(([True], boundary)))
+    group_count = len(group_starts)
+    counts = np.diff(np.append(group_starts, n))
+    group_of = np.repeat(np.arange(group_count), counts)
+
+    same_group = ~boundary
+    gaps = np.diff(sorted_indices)[same_group]
+    gap_group = group_of[1:][same_group]
+    gap_counts = counts - 1
+
+    gap_avg = np.zeros(group_count)
+    has_gap = gap_counts > 0
+    gap_sum = np.bincount(gap_group, weights=gaps, minlength=group_count)
+    gap_avg[has_gap] = gap_sum[has_gap] / gap_counts[has_gap]
+
+    deviations = gaps - gap_avg[gap_group]
+    squared_sum = np.bincount(gap_group, weights=deviations * deviations, minlength=group_count)
+    gap_sd = np.zeros(group_count)
+    has_sd = gap_counts > 1
+    gap_sd[has_sd] = np.sqrt(squared_sum[has_sd] / gap_counts[has_sd])
+    for g in np.flatnonzero(gap_counts >= _small_group_gaps):
+        start = group_starts[g]
+        gap_sd[g] = np.std(np.diff(sorted_indices[start:start + counts[g]]))
+
+    first_pos = np.minimum.reduceat(order, group_starts)
+    last_pos = np.maximum.reduceat(order, group_starts)
+    return order, group_starts, counts, gap_avg, gap_sd, first_pos, last_pos
+
+
+def _build_document_tokens(
+    parsed_segments: Union[TokenBuffer, List[List[SegmentTokens]]],
+    document_name: str,
+    document_path: str,
+    cate1: str,
+    cate2: str
+) -> List[DocumentToken]:
+    """
+    (단어, 분할 id)별 토큰 테이블 행을 만듭니다.
+    - 행 순서: 그룹이 처음 등장한 순서
+    - word_type, pii_type, index: 그룹의 마지막 토큰 값
+    """
+    buffer = _token_columns(parsed_segments)
+    if len(buffer) == 0:
+        return []
+
+    word_ids = np.asarray(buffer.word_ids, dtype=np.int64)
+    seg_ids = np.asarray(buffer.seg_ids, dtype=np.int64)
+    indices = np.asarray(buffer.indices, dtype=np.int64)
+    order, group_starts, counts, gap_avg, gap_sd, first_pos, last_pos = _group_gap_stats(word_ids, seg_ids, indices)
+    sorted_indices = indices[order]
+
+    regi_date = date.today()
+    results = []
+    for g in np.argsort(first_pos, kind="stable").tolist():
+        last = int(last_pos[g])
+        start = int(group_starts[g])
+        count = int(counts[g])
 
         results.append(DocumentToken(
-            value=info["value"],
-            word_type=info["word_type"],
-            document_name=info["document_name"],
-            document_path=info["document_path"],
-            cate1=info["cate1"],
-            cate2=info["cate2"],
-            pii_type=info["pii_type"],
-            regi_date=info["regi_date"],
-            gap_avg=gap_avg,
-            gap_sd=gap_sd,
-            index_list=sorted_indices,
-            col_id=seg_id,                  # ✅ 하나의 seg_id만
-            col_cnt=len(sorted_indices) ,     # ✅ 해당 분할 내 등장 횟수
-            index=info['index']
+            value=buffer.vocab[buffer.word_ids[last]],
+            word_type=buffer.tag_names[buffer.tag_codes[last]],
+            document_name=document_name,
+            document_path=document_path,
+            cate1=cate1,
+            cate2=cate2,
+            pii_type=buffer.pii_names[buffer.pii_codes[last]],
+            regi_date=regi_date,
+            gap_avg=float(gap_avg[g]),
+            gap_sd=float(gap_sd[g]),
+            index_list=sorted_indices[start:start + count].tolist(),
+            col_id=buffer.seg_ids[last],     # ✅ 하나의 seg_id만
+            col_cnt=count,                   # ✅ 해당 분할 내 등장 횟수
+            index=buffer.indices[last]
         ))
-    logger.info(f"[analysis_document.py] 총 {len(results)}개의 문서 내 토큰 테이블 행 생성")
 
     return results
 
@@ -110,8 +205,118 @@ def enrich_token_frequencies(tokens: List[DocumentToken]) -> List[DocumentToken]
 
     return tokens
 
+def _first_value_of_row(first_values: pd.Series, word_of_row: pd.Series) -> pd.Series:
+    return pd.Series(first_values.reindex(word_of_row).values, index=word_of_row.index)
+
+
+def compute_document_statistics(df: pd.DataFrame) -> Dict:
+    """
+    문서 하나의 토큰 테이블 행(word, word_type, col_id, col_cnt, cate1, cate2)으로 문서 통계를 계산합니다.
+
+    (단어 x 분할) 빈도표를 한 번 만들고, 단어별 평균/표준편차(ddof=1)와 빈도를 열 단위로 한 번에 계산합니다.
+    단어는 이름 순, 분할은 col_id 순이며 없는 분할의 빈도는 0입니다.
+
+    Returns:
+        {"total_words", "word_types", "word_statistics", "overall_statistics"}
+    """
+    word_counts = df.groupby(['word', 'col_id'], sort=True)['col_cnt'].sum()
+    pivot = word_counts.unstack(fill_value=0)
+    words = pivot.index.tolist()
+    col_ids = [int(col_id) for col_id in pivot.columns]
+    frequencies = pivot.to_numpy()
+
+    averages = pivot.mean(axis=1).tolist()
+    std_devs = pivot.std(axis=1, ddof=1).tolist()
+
+    # 단어별 첫 행의 품사/분류 기준 빈도 (한 문서 안에서는 모두 문서 전체 빈도와 같음)
+    # 첫 행은 값이 비어 있어도 그대로 사용 (groupby.first()는 빈 값을 건너뜀)
+    # 빈 분류 값은 어떤 행과도 같지 않은 것으로 봄 (pandas의 == 비교와 같음)
+    first_rows = df.drop_duplicates('word').set_index('word')[['word_type', 'cate1', 'cate2']]
+    word_of_row = df['word']
+    total_counts = frequencies.sum(axis=1).tolist()
+    cate1_counts = df['col_cnt'].where(df['cate1'].eq(_first_value_of_row(first_rows['cate1'], word_of_row)), 0) \
+        .groupby(word_of_row, sort=True).sum().reindex(words).tolist()
+    cate2_counts = df['col_cnt'].where(df['cate2'].eq(_first_value_of_row(first_rows['cate2'], word_of_row)), 0) \
+        .groupby(word_of_row, sort=True).sum().reindex(words).tolist()
+    word_types = first_rows['word_type'].reindex(words).tolist()
+
+    word_statistics = {}
+    for k, word in enumerate(words):
+        total_count = int(total_counts[k])
+        word_statistics[word] = {
+            'average': float(averages[k]),
+            'std_dev': float(std_devs[k]),
+            'word_type': word_types[k],
+            'total_cnt': total_count,
+            'cate1_cnt': int(cate1_counts[k]),
+            'cate2_cnt': int(cate2_counts[k]),
+            'doc_cnt': total_count,
+            'segment_frequencies': dict(zip(col_ids, frequencies[k].tolist()))
+        }
+
+    all_frequencies = pd.Series(frequencies.ravel())
+    statistics = {
+        "total_words": int(len(df)),
+        "word_types": {word_type: int(count) for word_type, count in df['word_type'].value_counts().items()},
+        "word_statistics": word_statistics,
+        "overall_statistics": {
+            "average": float(all_frequencies.mean()),
+            "std_dev": float(all_frequencies.std())
+        } if len(all_frequencies) else {}
+    }
+    return statistics
+
+
 if __name__ == "__main__":
+    import time
+
+    # 벡터화 통계와 기존 방식(그룹별 np.mean/np.std)의 처리 시간 (결과 비교는 tests/test_analysis_document.py)
+    rng = np.random.default_rng(0)
+    token_count = 1_000_000
+    bench_indices = np.cumsum(rng.integers(0, 3, token_count))
+    bench_words = rng.integers(0, 20000, token_count)
+    bench_segs = bench_indices // 2000 + 1
+
+    start = time.perf_counter()
+    order, group_starts, counts, gap_avg, gap_sd, first_pos, last_pos = _group_gap_stats(bench_words, bench_segs, bench_indices)
+    print(f"vectorized: {time.perf_counter() - start:.2f}s, {len(group_starts)} groups")
+
+    start = time.perf_counter()
+    reference = defaultdict(list)
+    for word, seg_id, idx in zip(bench_words.tolist(), bench_segs.tolist(), bench_indices.tolist()):
+        reference[(word, seg_id)].append(idx)
+    for indices_of_group in reference.values():
+        sorted_idx = sorted(indices_of_group)
+        gap_values = [j - i for i, j in zip(sorted_idx[:-1], sorted_idx[1:])]
+        gap_avg = float(np.mean(gap_values)) if gap_values else 0.0
+        gap_sd = float(np.std(gap_values)) if len(gap_values) > 1 else 0.0
+    print(f"reference: {time.perf_counter() - start:.2f}s")
+
+    # 문서 통계: 50,000 토큰 문서에서 (단어 x 분할) 빈도표 방식과 기존 단어별 필터링 방식의 처리 시간
+    token_count = 50_000
+    bench_words = [f"단어{i}" for i in rng.zipf(1.3, token_count) % 5000]
+    bench_segs = (np.arange(token_count) // 500 + 1).tolist()
+    token_rows = pd.DataFrame({'word': bench_words, 'col_id': bench_segs, 'col_cnt': 1})
+    token_rows = token_rows.groupby(['word', 'col_id'], sort=False, as_index=False)['col_cnt'].sum()
+    token_rows['word_type'] = 'noun'
+    token_rows['cate1'] = '기술'
+    token_rows['cate2'] = 'AI'
+
+    start = time.perf_counter()
+    statistics = compute_document_statistics(token_rows)
+    print(f"pivot: {time.perf_counter() - start:.3f}s, {len(statistics['word_statistics'])} words")
+
+    start = time.perf_counter()
+    all_col_ids = sorted(token_rows['col_id'].unique())
+    for word, word_group in token_rows.groupby('word'):
+        all_frequencies = pd.Series(0, index=all_col_ids)
+        all_frequencies.update(word_group.groupby('col_id')['col_cnt'].sum())
+        first_row = word_group.iloc[0]
+        total_count = int(token_rows[token_rows['word'] == word]['col_cnt'].sum())
+        cate1_count = int(token_rows[(token_rows['word'] == word) & (token_rows['cate1'] == first_row['cate1'])]['col_cnt'].sum())
+    print(f"reference: {time.perf_counter() - start:.3f}s")
     
+
     # parsed_segments = [
     #     SegmentTokens(segment_tokens=[
     #         Token(idx=0, word='Google', tag='alphabet', lang='kor', seg_id=1),
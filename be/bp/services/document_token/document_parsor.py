@@ -1,61 +1,204 @@
 from unstructured.partition.pdf import partition_pdf
 # from unstructured.partition.ppt import partition_ppt
-# from unstructured.partition.pptx import partition_pptx
-# from unstructured.partition.xml import partition_xml
-# from unstructured.partition.doc import partition_doc, partition_docx
+# from unstructured.partition.doc import partition_doc
 from unstructured.documents.elements import Element
 
-from typing import List
+from typing import List, Dict, Tuple, Optional, Iterator
+from concurrent.futures import wait
+import multiprocessing
 import os
+import tempfile
+import time
 
 
 from bp.utils.loggers import setup_logger
+from bp.services.document_token.parse_cache import get_parse_cache, file_content_hash
+from bp.services.document_token.image_store import get_image_store
+from bp.services.document_token.segment_builder import iter_segments
+from bp.views.segment import Segment
+from bp.services.document_token.pdf_pages import probe_pages, count_pages, group_page_runs, write_page_range, PageProbe
+from bp.services.document_token.parser_pool import get_parser_pool, ParserPool, ParseJob
+from bp.services.document_token.native_partitioners import get_native_partitioner
+from config import (
+    parse_cache_enabled, partition_strategy, extract_images,
+    adaptive_min_chars, adaptive_max_garbled_ratio, adaptive_max_image_coverage,
+    shard_pages, shard_min_pages, parser_pool_enabled
+)
 
 logger = setup_logger()
 
+
+def partition_pdf_file(filename: str, strategy: str, languages: List[str], extract_options: Dict,
+                       starting_page_number: int = 1) -> List[Element]:
+    logger.info(f"[document_parsor.py]{filename} 문서 기본 파싱 (strategy: {strategy})")
+    elements = partition_pdf(
+        filename=filename,                  # mandatory
+        strategy=strategy,                                     # mandatory to use ``hi_res`` strategy
+        **extract_options,                                     # 이미지 추출 시 extract_image_block_types, ...
+        content_type="application/pdf", languages=languages,
+        starting_page_number=starting_page_number
+        )
+    return elements
+
+
+def partition_pdf_range(file_path: str, start: int, end: int, strategy: str, languages: List[str],
+                        extract_options: Dict, output_dir: str) -> List[Element]:
+    """
+    PDF의 [start, end) 페이지만 잘라서 파싱합니다. (파서 워커에서 실행 가능)
+    페이지 번호 메타데이터는 원본 문서 기준으로 유지됩니다.
+    """
+    range_path = write_page_range(file_path, start, end, output_dir)
+    try:
+        return partition_pdf_file(range_path, strategy, languages, extract_options, starting_page_number=start + 1)
+    finally:
+        os.remove(range_path)
+
+
 class DocumentParser:
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, use_cache: bool = parse_cache_enabled, extract_images: bool = extract_images):
         self.file_path = file_path
         self.file_dir, extension = os.path.splitext(file_path)
         self.extension = extension[1:]
         self.languages = ["eng", "kor"]
-        self.strategy = "hi_res"
+        self.strategy = partition_strategy  # hi_res, fast, adaptive
+        # 이미지 추출은 필요한 문서에서만 켬. 이미지는 payload(base64)로 받아 이미지 저장소에 저장
+        self.extract_options = {
+            "extract_image_block_types": ["Image", "Table"],
+            "extract_image_block_to_payload": True,
+        } if extract_images else {}
+        self.use_cache = use_cache
         self.elements = []
+        self.page_strategies: Dict[int, str] = {}  # {페이지 번호: 사용한 strategy}
+        self.image_manifest = None  # 추출한 이미지 목록 파일 경로
+        self.segments: List[Segment] = []  # 분할 텍스트와 페이지/문자 위치 정보
+        self._content_hash = None
+
+    @property
+    def content_hash(self) -> str:
+        if self._content_hash is None:
+            self._content_hash = file_content_hash(self.file_path)
+        return self._content_hash
         
     def _partition_documents(self) -> List[Element]:
+        self.elements = list(self._iter_elements())
+        return self.elements
+
+    def _iter_elements(self) -> Iterator[Element]:
         
+        native_partitioner = get_native_partitioner(self.extension)
         if self.extension == 'pdf':
-            self.elements = self._partition_pdf()
+            yield from self._iter_pdf_elements()
+        elif native_partitioner is not None:
+            # docx, pptx, xml: OCR/레이아웃 모델 없이 문서 구조를 직접 읽음
+            logger.info(f"[document_parsor.py]{self.file_path} 문서 구조 파싱 ({self.extension})")
+            yield from native_partitioner(self.file_path)
         # elif self.extension == 'doc':
         #     elements = self._partition_doc()
-        # elif self.extension == 'docx':
-        #     elements = self.partition_docx()
         # elif self.extension == 'ppt':
         #     elements = self.partition_ppt()
-        # elif self.extension == 'pptx':
-        #     elements = self.partition_pptx()
         else:
             raise ValueError(f"Unsupported file extension: {self.extension}")
-
-        
-        return self.elements
     
     def _partition_pdf(self) -> List[Element]:
-        images_dir = '/root/docs_parsing/src'
-        
-        # if not os.path.exists(images_dir): os.makedirs(images_dir)
-        logger.info(f"[document_parsor.py]{self.file_path} 문서 기본 파싱")
-        elements = partition_pdf(
-            filename=self.file_path,                  # mandatory
-            strategy=self.strategy,                                     # mandatory to use ``hi_res`` strategy
-            extract_images_in_pdf=True,                            # mandatory to set as ``True``
-            extract_image_block_types=["Image", "Table"],          # optional
-            extract_image_block_to_payload=False,                  # optional
-            extract_image_block_output_dir=images_dir,  # optional - only works when ``extract_image_block_to_payload=False``
-            content_type="application/pdf", languages=self.languages
-            )
-        return elements
+        return list(self._iter_pdf_elements())
+
+    def _iter_pdf_elements(self) -> Iterator[Element]:
+        """
+        1. adaptive이면 페이지별 strategy를 정하고 같은 strategy의 연속 페이지를 묶음
+        2. 큰 문서는 shard_pages 단위의 페이지 구간으로 나눔
+        3. 구간들을 파서 워커 풀에서 병렬로 파싱하고, 앞 구간부터 끝나는 대로 페이지 순서대로 내보냄
+        시간/메모리 제한은 구간마다가 아니라 문서 전체에 적용 (모든 구간이 같은 ParseJob 사용)
+        """
+        if self.strategy == "adaptive":
+            runs = self._plan_adaptive_runs()
+            page_count = runs[-1][1] if runs else 0
+        else:
+            page_count = count_pages(self.file_path)
+            runs = [(0, page_count, self.strategy)]
+
+        if not runs:
+            return
+
+        pool = self._parser_pool()
+        job = pool.new_job() if pool is not None else None
+        ranges = self._shard_runs(runs, page_count)
+        if len(ranges) == 1:
+            args = (self.file_path, ranges[0][2], self.languages, self.extract_options)
+            if pool is not None:
+                yield from pool.submit(partition_pdf_file, *args, job=job).result()
+            else:
+                yield from partition_pdf_file(*args)
+            return
+        yield from self._iter_range_elements(ranges, pool, job)
+
+    def _parser_pool(self) -> Optional[ParserPool]:
+        # 자식 프로세스 안에서는 프로세스를 더 만들지 않고 직접 파싱
+        if not parser_pool_enabled or multiprocessing.parent_process() is not None:
+            return None
+        return get_parser_pool()
+
+    def _page_strategy(self, probe: PageProbe) -> str:
+        """
+        텍스트 레이어가 충분하면 fast, 스캔본이거나 이미지 위주 페이지는 hi_res
+        """
+        if (probe.char_count >= adaptive_min_chars
+                and probe.garbled_ratio <= adaptive_max_garbled_ratio
+                and probe.image_coverage <= adaptive_max_image_coverage):
+            return "fast"
+        return "hi_res"
+
+    def _plan_adaptive_runs(self) -> List[Tuple[int, int, str]]:
+        """
+        페이지별 텍스트 레이어를 점검하여 fast / hi_res 중 하나를 정하고,
+        같은 strategy의 연속된 페이지를 하나의 구간으로 묶습니다.
+        """
+        probes = probe_pages(self.file_path)
+        strategies = [self._page_strategy(probe) for probe in probes]
+        self.page_strategies = {probe.page_number: strategy for probe, strategy in zip(probes, strategies)}
+        fast_count = strategies.count("fast")
+        logger.info(f"[document_parsor.py]{self.file_path} 페이지별 strategy - fast: {fast_count}, hi_res: {len(strategies) - fast_count}")
+
+        return group_page_runs(strategies)
+
+    def _shard_runs(self, runs: List[Tuple[int, int, str]], page_count: int) -> List[Tuple[int, int, str]]:
+        """
+        shard_min_pages 이상인 문서의 구간을 shard_pages 페이지씩 나눕니다.
+        """
+        if page_count < shard_min_pages:
+            return runs
+
+        ranges = []
+        for start, end, strategy in runs:
+            for shard_start in range(start, end, shard_pages):
+                ranges.append((shard_start, min(shard_start + shard_pages, end), strategy))
+        return ranges
+
+    def _iter_range_elements(self, ranges: List[Tuple[int, int, str]], pool: Optional[ParserPool],
+                             job: Optional[ParseJob]) -> Iterator[Element]:
+        logger.info(f"[document_parsor.py]{self.file_path} {len(ranges)}개 페이지 구간 파싱 (parser pool: {pool is not None})")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            args = [
+                (self.file_path, start, end, strategy, self.languages, self.extract_options, tmp_dir)
+                for start, end, strategy in ranges
+            ]
+            if pool is not None:
+                futures = [pool.submit(partition_pdf_range, *arg, job=job) for arg in args]
+                try:
+                    # 제출 순서대로 결과를 내보내 페이지 순서를 유지
+                    for future in futures:
+                        yield from future.result()
+                finally:
+                    # 한 구간이 실패하거나 소비를 멈춘 경우: 대기 중인 구간은 취소하고 실행 중인 구간은 워커를 종료한 뒤,
+                    # 모두 끝나면 임시 디렉터리를 지움 (남은 구간이 파서 워커를 계속 차지하지 않도록)
+                    job.cancel()
+                    for future in futures:
+                        future.cancel()
+                    wait(futures)
+            else:
+                for arg in args:
+                    yield from partition_pdf_range(*arg)
     
     # def _partition_doc(self) -> List[Element]:
     #     elements = partition_doc(
@@ -65,14 +208,6 @@ class DocumentParser:
     #     )
     #     return elements
 
-    # def _partition_docx(self) -> List[Element]:
-    #     elements = partition_docx(
-    #         filename=self.file_path,
-    #         languages=self.languages,
-    #         strategy=self.strategy
-    #     )
-    #     return elements
-    
     # def _partition_ppt(self) -> List[Element]:
     #     elements = partition_ppt(
     #         filename=self.file_path,
@@ -80,40 +215,71 @@ class DocumentParser:
     #     )
     #     return elements
     
-    # def _partition_pptx(self) -> List[Element]:
-    #     elements = partition_pptx(
-    #         filename=self.file_path,
-    #         strategy=self.strategy
-    #     )
-    #     return elements
-    
-    # def _partition_xml(self) -> List[Element]:
-    #     elements = partition_xml(
-    #         filename=self.file_path,
-    #         xml_keep_tags=True
-    #     )
-    #     return elements
-    
     def _combine_elements(self, elements: List[Element]) -> List[str]:
-        result = []
-        text = ''
-        for i in range(len(elements)):
-            el = elements[i].to_dict()  
-            if el['type'] == 'Title':
-                result.append(text)
-                text = ''
-                text+=el['text']
-            elif i == len(elements)-1 :
-                text+=el['text']
-                result.append(text)
-            else:
-                text+=el['text']
-        return result
+        return [segment.text for segment in iter_segments(elements)]
     
-    def parse_doc_to_seg(self):
-        elements = self._partition_documents()
-        
-        return self._combine_elements(elements) 
+    def _cache_settings(self) -> dict:
+        """
+        파싱 결과에 영향을 주는 설정값 (캐시 키에 포함)
+        """
+        return {
+            "extension": self.extension,
+            "strategy": self.strategy if self.extension == 'pdf' else "native",
+            "languages": self.languages,
+            "extract_options": self.extract_options,
+            "adaptive": [adaptive_min_chars, adaptive_max_garbled_ratio, adaptive_max_image_coverage]
+                        if self.strategy == "adaptive" else None,
+            "format": "segment+page_strategies",  # 캐시 항목 형식 (Segment dict 리스트, 페이지별 strategy)
+        }
+
+    def _iter_elements_and_store_images(self) -> Iterator[Element]:
+        if not self.extract_options:
+            yield from self._iter_elements()
+            return
+
+        image_store = get_image_store()
+        images = []
+        for element in self._iter_elements():
+            image = image_store.store_element_image(element)
+            if image is not None:
+                images.append(image)
+            yield element
+        self.image_manifest = image_store.write_manifest(self.file_path, self.content_hash, images)
+
+    def iter_segments(self) -> Iterator[Segment]:
+        """
+        문서를 파싱하면서 분할이 완성되는 대로 Segment를 내보냅니다.
+        캐시에 있으면 파싱 없이 캐시의 분할과 페이지별 strategy를 내보냅니다.
+        """
+        cache = get_parse_cache() if self.use_cache else None
+        if cache is not None:
+            key = cache.make_key(self.content_hash, self._cache_settings())
+            cached = cache.get(key)
+            if cached is not None:
+                logger.info(f"[document_parsor.py]{self.file_path} 파싱 캐시 사용")
+                if self.extract_options:
+                    manifest_path = get_image_store().manifest_path(self.content_hash)
+                    self.image_manifest = manifest_path if os.path.exists(manifest_path) else None
+                # JSON 키는 문자열이므로 페이지 번호를 다시 int로
+                self.page_strategies = {int(page): strategy for page, strategy in cached.get('page_strategies', {}).items()}
+                self.segments = [Segment(**segment) for segment in cached['segments']]
+                yield from self.segments
+                return
+
+        start = time.perf_counter()
+        self.page_strategies = {}
+        self.segments = []
+        for segment in iter_segments(self._iter_elements_and_store_images()):
+            self.segments.append(segment)
+            yield segment
+
+        if cache is not None:
+            cache.put(key, [segment.model_dump() for segment in self.segments], time.perf_counter() - start,
+                      self.page_strategies)
+            logger.info(f"[document_parsor.py] 파싱 캐시 저장 ({cache.stats()})")
+
+    def parse_doc_to_seg(self) -> List[str]:
+        return [segment.text for segment in self.iter_segments()]
     
         
 if __name__=="__main__":
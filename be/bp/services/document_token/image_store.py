@@ -0,0 +1,121 @@
+from typing import List, Dict, Optional
+import base64
+import hashlib
+import json
+import os
+import tempfile
+
+from unstructured.documents.elements import Element
+
+from bp.utils.loggers import setup_logger
+from config import image_store_dir
+
+logger = setup_logger()
+
+mime_extension_dict = {
+    "image/jpeg": "jpg",
+    "image/jpg": "jpg",
+    "image/png": "png",
+}
+
+
+def _write_if_absent(path: str, data: bytes) -> bool:
+    """
+    같은 내용의 파일이 이미 있으면 쓰지 않습니다. 새로 쓴 경우 True
+
+    같은 이미지를 여러 스레드/프로세스가 동시에 쓸 수 있으므로 쓰기마다 고유한 임시 파일을 사용합니다.
+    파일 이름이 내용 해시이므로 다른 쪽이 먼저 써서 교체에 실패해도 같은 내용이 저장된 것으로 봅니다.
+    """
+    if os.path.exists(path):
+        return False
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        if os.path.exists(path):
+            return False
+        raise
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class ImageStore:
+    """
+    문서에서 추출한 Image/Table 이미지를 내용 해시 이름으로 저장하는 저장소
+
+    - images/<해시 앞 2자리>/<sha256>.<확장자>: 같은 이미지는 한 번만 저장
+    - manifests/<문서 해시>.json: 문서별 이미지 목록 (페이지, 요소 유형, 이미지 경로)
+    """
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+
+    def image_path(self, digest: str, extension: str) -> str:
+        return os.path.join(self.store_dir, "images", digest[:2], f"{digest}.{extension}")
+
+    def manifest_path(self, document_hash: str) -> str:
+        return os.path.join(self.store_dir, "manifests", f"{document_hash}.json")
+
+    def store_element_image(self, element: Element) -> Optional[Dict]:
+        """
+        요소에 담긴 이미지(base64)를 저장소에 저장하고 manifest 항목을 반환합니다.
+        저장 후에는 요소에서 base64 데이터를 제거해 메모리를 줄입니다.
+        """
+        image_base64 = getattr(element.metadata, "image_base64", None)
+        if not image_base64:
+            return None
+
+        data = base64.b64decode(image_base64)
+        digest = hashlib.sha256(data).hexdigest()
+        extension = mime_extension_dict.get(element.metadata.image_mime_type, "jpg")
+        path = self.image_path(digest, extension)
+        _write_if_absent(path, data)
+        element.metadata.image_base64 = None
+
+        return {
+            "page_number": element.metadata.page_number,
+            "type": element.category,
+            "sha256": digest,
+            "path": path
+        }
+
+    def write_manifest(self, file_path: str, document_hash: str, images: List[Dict]) -> Optional[str]:
+        """
+        문서별 이미지 목록을 저장합니다. 내용이 같으면 다시 쓰지 않습니다.
+        """
+        if not images:
+            return None
+
+        manifest = json.dumps({"file_path": file_path, "images": images}, ensure_ascii=False, indent=4)
+        manifest_path = self.manifest_path(document_hash)
+        previous_manifest = None
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                previous_manifest = f.read()
+        if previous_manifest != manifest:
+            os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                f.write(manifest)
+
+        logger.info(f"[image_store.py]{file_path} 이미지 {len(images)}개 manifest 저장")
+        return manifest_path
+
+    def save_document_images(self, file_path: str, document_hash: str, elements: List[Element]) -> Optional[str]:
+        images = [image for image in map(self.store_element_image, elements) if image is not None]
+        return self.write_manifest(file_path, document_hash, images)
+
+
+_image_store = None
+
+
+def get_image_store() -> ImageStore:
+    global _image_store
+    if _image_store is None:
+        _image_store = ImageStore(image_store_dir)
+    return _image_store
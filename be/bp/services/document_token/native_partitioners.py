@@ -0,0 +1,143 @@
+from typing import Iterator, Optional
+import os
+import xml.etree.ElementTree as ET
+
+from docx import Document as DocxDocument
+from docx.table import Table as DocxTable
+from docx.text.paragraph import Paragraph as DocxParagraph
+from docx.oxml.ns import qn
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
+from unstructured.documents.elements import Element, ElementMetadata, NarrativeText, Title
+
+from bp.utils.loggers import setup_logger
+
+logger = setup_logger()
+
+# 분할 기준(Title)으로 볼 스타일/태그
+docx_title_styles = ("title", "heading", "제목")
+pptx_title_placeholders = (PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE)
+xml_title_tags = {"title", "head", "heading", "h1", "h2", "h3", "h4", "h5", "h6"}
+
+
+def _make_element(text: str, is_title: bool, file_path: str, page_number: Optional[int] = None) -> Element:
+    metadata = ElementMetadata(filename=os.path.basename(file_path), page_number=page_number)
+    if is_title:
+        return Title(text=text, metadata=metadata)
+    return NarrativeText(text=text, metadata=metadata)
+
+
+def _is_docx_title(paragraph: DocxParagraph) -> bool:
+    style_name = (paragraph.style.name or "").lower() if paragraph.style is not None else ""
+    return style_name.startswith(docx_title_styles)
+
+
+def _docx_page_breaks(block) -> int:
+    """
+    문단/표 안의 명시적 페이지 나눔과 Word가 기록한 페이지 경계의 수
+    """
+    breaks = 0
+    for br in block.iter(qn("w:br")):
+        if br.get(qn("w:type")) == "page":
+            breaks += 1
+    breaks += sum(1 for _ in block.iter(qn("w:lastRenderedPageBreak")))
+    return breaks
+
+
+def partition_docx_native(file_path: str) -> Iterator[Element]:
+    """
+    python-docx로 본문 문단과 표를 문서 순서대로 읽습니다.
+    제목/Heading 스타일 문단은 Title, 나머지는 NarrativeText로 만듭니다.
+    페이지 번호는 페이지 나눔 정보가 있는 경우에만 의미가 있습니다.
+    """
+    document = DocxDocument(file_path)
+    page_number = 1
+    for block in document.element.body.iterchildren():
+        if block.tag == qn("w:p"):
+            paragraph = DocxParagraph(block, document)
+            text = paragraph.text.strip()
+            if text:
+                yield _make_element(text, _is_docx_title(paragraph), file_path, page_number)
+        elif block.tag == qn("w:tbl"):
+            table = DocxTable(block, document)
+            rows = [" ".join(cell.text.strip() for cell in row.cells if cell.text.strip()) for row in table.rows]
+            text = "\n".join(row for row in rows if row)
+            if text:
+                yield _make_element(text, False, file_path, page_number)
+        else:
+            continue
+        page_number += _docx_page_breaks(block)
+
+
+def _iter_pptx_shape_texts(shapes) -> Iterator[tuple]:
+    """
+    슬라이드 도형에서 (텍스트, 제목 여부)를 도형 순서대로 꺼냅니다. 그룹 도형은 안쪽까지 읽습니다.
+    """
+    for shape in shapes:
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            yield from _iter_pptx_shape_texts(shape.shapes)
+        elif shape.has_text_frame:
+            is_title = shape.is_placeholder and shape.placeholder_format.type in pptx_title_placeholders
+            yield shape.text_frame.text.strip(), is_title
+        elif getattr(shape, "has_table", False) and shape.has_table:
+            rows = [" ".join(cell.text.strip() for cell in row.cells if cell.text.strip()) for row in shape.table.rows]
+            yield "\n".join(row for row in rows if row), False
+
+
+def partition_pptx_native(file_path: str) -> Iterator[Element]:
+    """
+    python-pptx로 슬라이드 순서대로 도형 텍스트를 읽습니다.
+    제목 placeholder는 Title, 나머지는 NarrativeText이며 페이지 번호는 슬라이드 번호입니다.
+    """
+    presentation = Presentation(file_path)
+    for slide_number, slide in enumerate(presentation.slides, start=1):
+        for text, is_title in _iter_pptx_shape_texts(slide.shapes):
+            if text:
+                yield _make_element(text, is_title, file_path, slide_number)
+
+
+def _xml_local_name(tag) -> str:
+    if not isinstance(tag, str):
+        return ""  # 주석, 처리 명령
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+def _iter_xml_elements(node: ET.Element, file_path: str) -> Iterator[Element]:
+    if _xml_local_name(node.tag) in xml_title_tags:
+        text = "".join(node.itertext()).strip()
+        if text:
+            yield _make_element(text, True, file_path)
+    else:
+        text = (node.text or "").strip()
+        if text:
+            yield _make_element(text, False, file_path)
+        for child in node:
+            yield from _iter_xml_elements(child, file_path)
+
+    # 혼합 내용(mixed content)의 자식 뒤 텍스트
+    tail = (node.tail or "").strip()
+    if tail:
+        yield _make_element(tail, False, file_path)
+
+
+def partition_xml_native(file_path: str) -> Iterator[Element]:
+    """
+    XML의 텍스트를 문서 순서대로 읽습니다. title/head/h1~h6 태그는 Title, 나머지 텍스트는 NarrativeText입니다.
+    """
+    root = ET.parse(file_path).getroot()
+    root.tail = None
+    yield from _iter_xml_elements(root, file_path)
+
+
+native_partitioner_dict = {
+    "docx": partition_docx_native,
+    "pptx": partition_pptx_native,
+    "xml": partition_xml_native,
+}
+
+
+def get_native_partitioner(extension: str):
+    """
+    OCR/레이아웃 모델 없이 문서 구조를 직접 읽는 파서를 반환합니다. 지원하지 않으면 None
+    """
+    return native_partitioner_dict.get(extension.lower())
@@ -0,0 +1,149 @@
+from typing import List, Optional, Dict
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from bp.utils.loggers import setup_logger
+from config import parse_cache_dir, parse_cache_max_bytes
+
+logger = setup_logger()
+
+
+def file_content_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    파일 내용의 sha256 해시값을 반환합니다.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    문서 파싱 결과(Segment dict 리스트와 페이지별 strategy)를 디스크에 저장하는 캐시
+
+    1. 키: 파일 내용 해시 + 파서 설정(strategy, languages, 추출 옵션)
+    2. 용량(max_bytes)을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+    3. hit/miss 횟수와 캐시로 절약한 파싱 시간을 기록
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def make_key(self, content_hash: str, settings: Dict) -> str:
+        settings_json = json.dumps(settings, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(f"{content_hash}:{settings_json}".encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Returns:
+            {'segments': Segment dict 리스트, 'page_strategies': {페이지 번호(str): strategy}, ...} 또는 None
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # LRU 순서를 위해 마지막 사용 시각 갱신
+        try:
+            os.utime(path, None)
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self.hits += 1
+            self.saved_seconds += entry.get('parse_seconds', 0.0)
+        logger.info(f"[parse_cache.py] cache hit ({self.stats()})")
+        return entry
+
+    def put(self, key: str, segments: List[Dict], parse_seconds: float, page_strategies: Dict[int, str] = None):
+        """
+        파싱 결과를 저장합니다. 캐시 저장에 실패해도 파싱 결과는 그대로 쓸 수 있으므로 기록만 하고 넘어갑니다.
+        """
+        path = self._entry_path(key)
+        entry = {'segments': segments, 'page_strategies': page_strategies or {}, 'parse_seconds': parse_seconds}
+        # 같은 프로세스의 여러 스레드가 같은 문서를 저장할 수 있으므로 쓰기마다 고유한 임시 파일 사용
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)  # 다른 프로세스가 쓰는 중인 파일을 읽지 않도록 원자적으로 교체
+            tmp_path = None
+            self._evict()
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"[parse_cache.py] 캐시 저장 실패: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def _evict(self):
+        """
+        캐시 전체 크기가 max_bytes 이하가 될 때까지 오래된 항목부터 삭제합니다.
+        """
+        entries = []
+        total_bytes = 0
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith('.json'):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total_bytes += stat.st_size
+
+        if total_bytes <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+            logger.info(f"[parse_cache.py] 캐시 항목 삭제: {os.path.basename(path)}")
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'saved_seconds': round(self.saved_seconds, 2)
+        }
+
+
+_parse_cache = None
+
+
+def get_parse_cache() -> ParseCache:
+    """
+    프로세스 내에서 공유하는 ParseCache를 반환합니다.
+    """
+    global _parse_cache
+    if _parse_cache is None:
+        _parse_cache = ParseCache(parse_cache_dir, parse_cache_max_bytes)
+    return _parse_cache
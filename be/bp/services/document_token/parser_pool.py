@@ -0,0 +1,335 @@
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional
+import atexit
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import weakref
+
+import psutil
+
+from bp.utils.loggers import setup_logger
+from config import (
+    parser_pool_workers, parser_worker_threads,
+    parse_timeout_seconds, parse_max_rss_mb, parser_max_documents_per_worker
+)
+
+logger = setup_logger()
+
+# 워커는 멀티스레드 Flask 프로세스의 디스패처 스레드에서 필요할 때 띄우므로, 부모의 lock 상태를 물려받는 fork 대신 spawn 사용
+_mp_context = multiprocessing.get_context("spawn")
+
+
+class ParseWorkerError(RuntimeError):
+    """파서 워커 프로세스가 작업을 끝내지 못한 경우"""
+
+
+class ParseTimeoutError(ParseWorkerError):
+    """작업 시간이 제한을 넘은 경우"""
+
+
+class ParseMemoryError(ParseWorkerError):
+    """워커 메모리(RSS)가 제한을 넘은 경우"""
+
+
+class ParseCancelledError(ParseWorkerError):
+    """같은 문서의 다른 작업이 실패해 작업을 중단한 경우"""
+
+
+def init_parser_worker(threads: int):
+    """
+    파서 워커 프로세스 초기화
+    1. torch/onnx/tesseract 스레드 수를 제한하여 여러 워커가 동시에 돌아도 CPU를 과점유하지 않게 함
+    2. hi_res 레이아웃 모델을 미리 불러와 요청마다 모델을 초기화하지 않게 함
+    """
+    for env in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "OMP_THREAD_LIMIT"):
+        os.environ[env] = str(threads)
+
+    import torch
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # 이미 병렬 작업이 시작된 경우 변경할 수 없음
+        pass
+
+    from unstructured_inference.models.base import get_model
+    get_model()  # 기본 레이아웃 모델을 프로세스 내에 캐싱
+    logger.info(f"[parser_pool.py] 파서 워커 준비 완료 (pid: {os.getpid()}, threads: {threads})")
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _worker_main(conn, threads: int):
+    """
+    워커 프로세스의 작업 루프. (fn, args)를 받아 실행하고 (성공 여부, 결과 또는 예외)를 돌려줌
+    """
+    init_parser_worker(threads)
+    while True:
+        task = conn.recv()
+        if task is None:
+            break
+        fn, args = task
+        try:
+            conn.send((True, fn(*args)))
+        except Exception as e:
+            try:
+                conn.send((False, e))
+            except Exception:
+                # pickle할 수 없는 예외는 메시지만 전달
+                conn.send((False, RuntimeError(repr(e))))
+
+
+class _Worker:
+
+    def __init__(self, threads: int):
+        self.conn, child_conn = _mp_context.Pipe()
+        self.process = _mp_context.Process(target=_worker_main, args=(child_conn, threads))
+        self.process.start()
+        child_conn.close()
+        self.documents_done = 0
+        self._jobs = weakref.WeakSet()  # 이 워커가 작업을 실행한 문서들
+
+    def count_job(self, job: "ParseJob"):
+        """
+        문서 단위로 작업 수를 셉니다. 같은 문서의 페이지 구간은 몇 개를 실행해도 한 번만 셈
+        """
+        if job not in self._jobs:
+            self._jobs.add(job)
+            self.documents_done += 1
+
+    def rss_bytes(self) -> int:
+        """
+        워커와 하위 프로세스(tesseract 등)의 메모리 사용량 합계
+        """
+        try:
+            process = psutil.Process(self.process.pid)
+            rss = process.memory_info().rss
+            for child in process.children(recursive=True):
+                try:
+                    rss += child.memory_info().rss
+                except psutil.NoSuchProcess:
+                    pass
+            return rss
+        except psutil.NoSuchProcess:
+            return 0
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self):
+        try:
+            for child in psutil.Process(self.process.pid).children(recursive=True):
+                child.kill()
+        except psutil.NoSuchProcess:
+            pass
+        self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class ParseJob:
+    """
+    문서 하나의 파싱 작업(페이지 구간)들이 함께 쓰는 제한과 취소 상태
+
+    - deadline: 문서 전체의 시간 제한 (첫 작업이 워커를 얻은 시각 + timeout). 구간을 몇 개로 나누어도 합계 시간에 적용
+      다른 문서의 작업 뒤에서 기다린 시간은 포함하지 않음
+    - 메모리 제한은 이 문서의 작업을 실행 중인 워커들의 RSS 합계에 적용
+    - cancel(): 아직 시작하지 않은 작업은 시작하지 않고, 실행 중인 작업은 워커를 종료
+    """
+
+    def __init__(self, timeout: float, max_rss_bytes: Optional[int]):
+        self.timeout = timeout
+        self.deadline: Optional[float] = None  # start()에서 설정
+        self.max_rss_bytes = max_rss_bytes
+        self._cancelled = threading.Event()
+        self._workers = set()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        작업이 워커를 얻었을 때 호출합니다. 시간 제한은 이 문서의 첫 작업이 시작할 때부터 잽니다.
+        """
+        with self._lock:
+            if self.deadline is None and self.timeout:
+                self.deadline = time.monotonic() + self.timeout
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() > self.deadline
+
+    def attach(self, worker: "_Worker"):
+        with self._lock:
+            self._workers.add(worker)
+
+    def detach(self, worker: "_Worker"):
+        with self._lock:
+            self._workers.discard(worker)
+
+    def rss_bytes(self) -> int:
+        with self._lock:
+            workers = list(self._workers)
+        return sum(worker.rss_bytes() for worker in workers)
+
+    def check(self):
+        """
+        취소되었거나 제한을 넘었으면 예외를 발생시킵니다.
+        """
+        if self.cancelled:
+            raise ParseCancelledError("파싱 작업이 취소되었습니다")
+        if self.expired():
+            raise ParseTimeoutError(f"파싱 시간 제한 초과 (문서당 {self.timeout}초)")
+        if self.max_rss_bytes:
+            rss = self.rss_bytes()
+            if rss > self.max_rss_bytes:
+                raise ParseMemoryError(f"파서 워커 메모리 제한 초과 (문서당 {rss // (1024 * 1024)}MB)")
+
+
+class ParserPool:
+    """
+    레이아웃 모델을 미리 불러온 상태로 유지하는 파서 워커 프로세스 풀
+
+    - 문서마다 시간 제한(timeout)과 메모리 제한(RSS)을 두고, 넘으면 워커를 종료하고 예외를 발생시킴
+      한 문서를 여러 작업으로 나누는 경우 new_job()으로 만든 ParseJob을 모든 작업에 넘겨 제한을 문서 단위로 적용
+    - hi_res의 메모리 누수를 막기 위해 워커는 max_documents_per_worker개 문서의 작업을 실행한 뒤 새로 띄움
+    - 워커는 필요할 때 띄우며, 종료된 워커 자리는 다음 작업에서 새 워커로 채움
+    """
+
+    poll_interval = 0.5
+
+    def __init__(self, workers: int, threads_per_worker: int, timeout: float = parse_timeout_seconds,
+                 max_rss_mb: int = parse_max_rss_mb, max_documents_per_worker: int = parser_max_documents_per_worker):
+        self.workers = workers
+        self.threads_per_worker = threads_per_worker
+        self.timeout = timeout
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024 if max_rss_mb else None
+        self.max_documents_per_worker = max_documents_per_worker
+        self._idle = queue.Queue()
+        for _ in range(workers):
+            self._idle.put(None)  # 아직 띄우지 않은 워커 자리
+        self._dispatcher = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parser-pool")
+
+    def _borrow(self) -> _Worker:
+        worker = self._idle.get()
+        if worker is None or not worker.process.is_alive():
+            try:
+                worker = _Worker(self.threads_per_worker)
+            except BaseException:
+                self._idle.put(None)  # 워커를 띄우지 못해도 자리는 돌려놓아 다음 작업에서 다시 시도
+                raise
+        return worker
+
+    def _release(self, worker: _Worker, healthy: bool):
+        if not healthy:
+            worker.kill()
+            worker = None
+        elif self.max_documents_per_worker and worker.documents_done >= self.max_documents_per_worker:
+            logger.info(f"[parser_pool.py] 워커 교체 (pid: {worker.process.pid}, 문서 수: {worker.documents_done})")
+            worker.stop()
+            worker = None
+        self._idle.put(worker)
+
+    def new_job(self) -> ParseJob:
+        """
+        문서 하나의 파싱 제한. 첫 작업이 워커를 얻은 때부터 timeout초 안에 문서의 모든 작업이 끝나야 합니다.
+        """
+        return ParseJob(self.timeout, self.max_rss_bytes)
+
+    def _wait_result(self, worker: _Worker, job: ParseJob):
+        while not worker.conn.poll(self.poll_interval):
+            if not worker.process.is_alive():
+                raise ParseWorkerError(f"파서 워커가 비정상 종료되었습니다 (exitcode: {worker.process.exitcode})")
+            job.check()
+        try:
+            return worker.conn.recv()
+        except EOFError:
+            raise ParseWorkerError(f"파서 워커가 비정상 종료되었습니다 (exitcode: {worker.process.exitcode})")
+
+    def run(self, fn, *args, job: Optional[ParseJob] = None):
+        """
+        워커 프로세스에서 fn(*args)를 실행하고 결과를 반환합니다.
+        job의 시간/메모리 제한을 넘거나 워커가 죽으면 ParseWorkerError를 발생시키고,
+        job이 취소되면 실행 중인 워커를 종료하고 ParseCancelledError를 발생시킵니다.
+        job이 없으면 이 작업만의 제한을 새로 만듭니다.
+        """
+        job = job if job is not None else self.new_job()
+        job.check()  # 취소되었거나, 같은 문서의 앞 작업들이 이미 제한 시간을 다 쓴 작업은 시작하지 않음
+        worker = self._borrow()
+        healthy = False
+        job.start()
+        job.attach(worker)
+        try:
+            worker.conn.send((fn, args))
+            ok, result = self._wait_result(worker, job)
+            healthy = True
+        finally:
+            job.detach(worker)
+            if healthy:
+                worker.count_job(job)
+            self._release(worker, healthy)
+
+        if not ok:
+            raise result
+        return result
+
+    def submit(self, fn, *args, job: Optional[ParseJob] = None) -> Future:
+        return self._dispatcher.submit(self.run, fn, *args, job=job)
+
+    def warm_up(self):
+        """
+        모든 워커 프로세스를 미리 띄워 모델 로딩을 끝내 둡니다.
+        """
+        futures = [self.submit(_ping) for _ in range(self.workers)]
+        pids = {future.result() for future in futures}
+        logger.info(f"[parser_pool.py] 파서 워커 {len(pids)}개 준비 (workers: {self.workers}, threads: {self.threads_per_worker})")
+
+    def shutdown(self):
+        self._dispatcher.shutdown(wait=True)
+        while not self._idle.empty():
+            worker = self._idle.get_nowait()
+            if worker is not None:
+                worker.stop()
+
+
+_parser_pool = None
+_parser_pool_lock = threading.Lock()
+
+
+def get_parser_pool() -> ParserPool:
+    """
+    프로세스 내에서 공유하는 ParserPool을 반환합니다.
+    """
+    global _parser_pool
+    if _parser_pool is None:
+        with _parser_pool_lock:
+            if _parser_pool is None:
+                _parser_pool = ParserPool(parser_pool_workers, parser_worker_threads)
+    return _parser_pool
+
+
+def shutdown_parser_pool():
+    global _parser_pool
+    with _parser_pool_lock:
+        if _parser_pool is not None:
+            _parser_pool.shutdown()
+            _parser_pool = None
+
+
+atexit.register(shutdown_parser_pool)
@@ -0,0 +1,111 @@
+from typing import List, NamedTuple, Tuple
+import os
+import unicodedata
+
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
+
+from bp.utils.loggers import setup_logger
+
+logger = setup_logger()
+
+
+class PageProbe(NamedTuple):
+    """
+    PDF 한 페이지의 텍스트 레이어 점검 결과
+    """
+    page_number: int        # 1부터 시작
+    char_count: int         # 공백을 제외한 추출 가능 문자 수
+    garbled_ratio: float    # 깨진 문자(대체 문자, 제어 문자, 사용자 정의 영역) 비율
+    image_coverage: float   # 페이지 면적 대비 이미지 면적 비율
+
+
+def _garbled_ratio(text: str) -> float:
+    chars = [c for c in text if not c.isspace()]
+    if not chars:
+        return 0.0
+    garbled = 0
+    for c in chars:
+        category = unicodedata.category(c)
+        if c == '\ufffd' or category in ('Cc', 'Co', 'Cs'):
+            garbled += 1
+    return garbled / len(chars)
+
+
+def _image_coverage(page) -> float:
+    width, height = page.get_size()
+    page_area = width * height
+    if page_area <= 0:
+        return 0.0
+
+    image_area = 0.0
+    for obj in page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_IMAGE]):
+        left, bottom, right, top = obj.get_pos()
+        image_area += max(0.0, right - left) * max(0.0, top - bottom)
+    return min(1.0, image_area / page_area)
+
+
+def probe_pages(file_path: str) -> List[PageProbe]:
+    """
+    PDF의 각 페이지에서 텍스트 레이어를 추출해 품질을 점검합니다.
+    """
+    probes = []
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        for i in range(len(pdf)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            text = textpage.get_text_range()
+            probes.append(PageProbe(
+                page_number=i + 1,
+                char_count=sum(1 for c in text if not c.isspace()),
+                garbled_ratio=_garbled_ratio(text),
+                image_coverage=_image_coverage(page)
+            ))
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    return probes
+
+
+def count_pages(file_path: str) -> int:
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def group_page_runs(page_strategies: List[str]) -> List[Tuple[int, int, str]]:
+    """
+    연속된 페이지 중 같은 strategy를 사용하는 구간을 묶습니다.
+
+    Returns:
+        [(시작 페이지 index, 끝 페이지 index(미포함), strategy), ...] (0부터 시작)
+    """
+    runs = []
+    for i, strategy in enumerate(page_strategies):
+        if runs and runs[-1][2] == strategy:
+            start, _, _ = runs[-1]
+            runs[-1] = (start, i + 1, strategy)
+        else:
+            runs.append((i, i + 1, strategy))
+    return runs
+
+
+def write_page_range(file_path: str, start: int, end: int, output_dir: str) -> str:
+    """
+    PDF의 [start, end) 페이지만 담은 새 PDF를 output_dir에 저장하고 경로를 반환합니다.
+    """
+    src = pdfium.PdfDocument(file_path)
+    dst = pdfium.PdfDocument.new()
+    try:
+        dst.import_pages(src, pages=list(range(start, end)))
+        base_name = os.path.splitext(os.path.basename(file_path))[0]
+        output_path = os.path.join(output_dir, f"{base_name}_{start + 1}-{end}.pdf")
+        dst.save(output_path)
+    finally:
+        dst.close()
+        src.close()
+    return output_path
@@ -0,0 +1,62 @@
+from typing import Iterable, Iterator, List, Optional
+
+from unstructured.documents.elements import Element
+
+from bp.views.segment import Segment
+
+
+class _SegmentBuffer:
+    """
+    하나의 분할을 만드는 동안 요소 텍스트와 페이지 범위를 모아 두는 버퍼
+    """
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.page_start: Optional[int] = None
+        self.page_end: Optional[int] = None
+
+    def add(self, element: Element):
+        self.parts.append(element.text)
+        page_number = getattr(element.metadata, "page_number", None)
+        if page_number is not None:
+            if self.page_start is None or page_number < self.page_start:
+                self.page_start = page_number
+            if self.page_end is None or page_number > self.page_end:
+                self.page_end = page_number
+
+    def build(self, seg_id: int, char_start: int) -> Segment:
+        text = ''.join(self.parts)  # 분할당 한 번만 이어 붙임
+        return Segment(
+            seg_id=seg_id,
+            text=text,
+            page_start=self.page_start,
+            page_end=self.page_end,
+            char_start=char_start,
+            char_end=char_start + len(text)
+        )
+
+
+def iter_segments(elements: Iterable[Element]) -> Iterator[Segment]:
+    """
+    요소를 순서대로 읽으면서 Title이 나올 때마다 직전까지의 분할을 바로 내보냅니다.
+    분할 결과는 기존 DocumentParser._combine_elements와 동일합니다.
+    - 첫 요소가 Title이면 빈 분할이 먼저 나옴
+    - 마지막 요소가 Title이면 그 Title만으로 된 분할은 나오지 않음
+    """
+    buffer = _SegmentBuffer()
+    seg_id = 1
+    char_offset = 0
+    last_is_title = None  # 요소가 하나도 없으면 None
+
+    for element in elements:
+        last_is_title = element.category == 'Title'
+        if last_is_title:
+            segment = buffer.build(seg_id, char_offset)
+            yield segment
+            seg_id += 1
+            char_offset = segment.char_end
+            buffer = _SegmentBuffer()
+        buffer.add(element)
+
+    if last_is_title is False:
+        yield buffer.build(seg_id, char_offset)
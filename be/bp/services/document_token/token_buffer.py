@@ -0,0 +1,99 @@
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from bp.views.tokens import Token, SegmentTokens
+
+
+class TokenBuffer:
+    """
+    문서 하나의 토큰을 열(column) 단위 배열로 저장하는 버퍼
+
+    토큰마다 pydantic Token을 만들지 않고, 단어/태그/개인정보 유형은 정수 코드로 바꿔
+    같은 길이의 배열 여러 개에 나누어 저장합니다.
+    - word_ids: 단어 id (vocab의 위치)
+    - tag_codes: 태그 코드 (tag_names의 위치)
+    - pii_codes: 개인정보 유형 코드 (pii_names의 위치, 0은 없음)
+    - indices: 문서 내 단어 인덱스
+    - seg_ids: 분할 id
+    pydantic 모델은 API 응답 등 경계에서만 to_segment_tokens()로 만듭니다.
+    """
+
+    def __init__(self, lang: str):
+        self.lang = lang
+        self.vocab: List[str] = []
+        self.tag_names: List[str] = []
+        self.pii_names: List[Optional[str]] = [None]
+        self._word_ids: Dict[str, int] = {}
+        self._tag_codes: Dict[str, int] = {}
+        self._pii_codes: Dict[Optional[str], int] = {None: 0}
+
+        self.word_ids = array('i')
+        self.tag_codes = array('H')
+        self.pii_codes = array('B')
+        self.indices = array('q')
+        self.seg_ids = array('i')
+        self.segment_offsets = array('q', [0])  # 분할 k의 토큰은 [segment_offsets[k], segment_offsets[k+1])
+
+    def __len__(self) -> int:
+        return len(self.word_ids)
+
+    @property
+    def segment_count(self) -> int:
+        return len(self.segment_offsets) - 1
+
+    def _intern(self, value, codes: Dict, names: List) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = len(names)
+            codes[value] = code
+            names.append(value)
+        return code
+
+    def append(self, word: str, tag: str, pii_type: Optional[str], index: int, seg_id: int):
+        self.word_ids.append(self._intern(word, self._word_ids, self.vocab))
+        self.tag_codes.append(self._intern(tag, self._tag_codes, self.tag_names))
+        self.pii_codes.append(self._intern(pii_type, self._pii_codes, self.pii_names))
+        self.indices.append(index)
+        self.seg_ids.append(seg_id)
+
+    def end_segment(self):
+        """
+        현재 분할을 닫습니다. 토큰이 없는 분할도 하나의 분할로 기록됩니다.
+        """
+        self.segment_offsets.append(len(self.word_ids))
+
+    def extend(self, other: "TokenBuffer"):
+        """
+        다른 버퍼의 토큰과 분할을 이어 붙입니다. 단어/태그 코드는 이 버퍼 기준으로 다시 매깁니다.
+        """
+        base = len(self)
+        word_map = [self._intern(word, self._word_ids, self.vocab) for word in other.vocab]
+        tag_map = [self._intern(tag, self._tag_codes, self.tag_names) for tag in other.tag_names]
+        pii_map = [self._intern(pii_type, self._pii_codes, self.pii_names) for pii_type in other.pii_names]
+
+        self.word_ids.extend(word_map[word_id] for word_id in other.word_ids)
+        self.tag_codes.extend(tag_map[tag_code] for tag_code in other.tag_codes)
+        self.pii_codes.extend(pii_map[pii_code] for pii_code in other.pii_codes)
+        self.indices.extend(other.indices)
+        self.seg_ids.extend(other.seg_ids)
+        self.segment_offsets.extend(base + offset for offset in other.segment_offsets[1:])
+
+    def iter_rows(self, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[str, str, Optional[str], int, int]]:
+        """
+        (단어, 태그, 개인정보 유형, 인덱스, 분할 id)를 토큰 순서대로 내보냅니다.
+        """
+        end = len(self) if end is None else end
+        vocab, tag_names, pii_names = self.vocab, self.tag_names, self.pii_names
+        for i in range(start, end):
+            yield (vocab[self.word_ids[i]], tag_names[self.tag_codes[i]], pii_names[self.pii_codes[i]],
+                   self.indices[i], self.seg_ids[i])
+
+    def to_segment_tokens(self) -> List[SegmentTokens]:
+        segment_tokens = []
+        for k in range(self.segment_count):
+            tokens = [
+                Token(idx=index, word=word, tag=tag, lang=self.lang, seg_id=seg_id, pii_type=pii_type)
+                for word, tag, pii_type, index, seg_id in self.iter_rows(self.segment_offsets[k], self.segment_offsets[k + 1])
+            ]
+            segment_tokens.append(SegmentTokens(segment_tokens=tokens))
+        return segment_tokens
@@ -0,0 +1,197 @@
+"""
+프로세스 내에서 공유하는 형태소 분석기(Kiwi)와 불용어 사전
+
+- Kiwi는 처음 한 번만 불러오고 이후 모든 문서/스레드에서 같은 인스턴스를 사용
+  (사용자 사전 추가 등 상태를 바꾸는 호출은 하지 않으므로 여러 스레드에서 동시에 분석해도 안전)
+- 불용어는 파일과 DB(stopwords 테이블)의 단어를 합친 frozenset 하나로 보관하고,
+  파일이 바뀌었거나 DB 불용어 버전(stopwords_meta)이 바뀐 경우에만 다시 읽음
+- word 모드의 단어별 분석 결과는 크기가 제한된 LRU 캐시에 보관하며, 항목마다 불용어 버전을 함께 기록
+"""
+
+from typing import Dict, FrozenSet, Optional, Tuple
+from collections import OrderedDict
+import os
+import threading
+import time
+
+from kiwipiepy import Kiwi
+
+from bp.utils.loggers import setup_logger
+from bp.repositories.stopwords_dictionary_repository import StopwordsRepository
+from bp.dbms.mariadb import connect
+from config import stopwords_file, db_stopwords_enabled, kiwi_num_workers, word_cache_enabled, word_cache_capacity
+
+logger = setup_logger()
+
+_kiwi: Optional[Kiwi] = None
+_kiwi_lock = threading.Lock()
+
+
+def get_kiwi() -> Kiwi:
+    global _kiwi
+    if _kiwi is None:
+        with _kiwi_lock:
+            if _kiwi is None:
+                start = time.perf_counter()
+                _kiwi = Kiwi(num_workers=kiwi_num_workers)
+                logger.info(f"[tokenizer_registry.py] Kiwi 로딩 완료 ({time.perf_counter() - start:.2f}s)")
+    return _kiwi
+
+
+class StopwordRegistry:
+    """
+    불용어 파일과 DB 불용어를 합쳐 frozenset으로 읽어 두는 저장소
+
+    문서마다 get()을 호출하면 파일의 수정 시각/크기와 DB 불용어 버전만 확인하고,
+    둘 중 하나가 바뀐 경우에만 다시 읽습니다. 다시 읽을 때마다 version이 1씩 증가합니다.
+    DB에 연결할 수 없으면 마지막으로 읽은 DB 불용어를 그대로 사용합니다.
+    DB 확인은 요청 연결과 섞이지 않도록 프로세스별 전용 연결로 합니다.
+    """
+
+    def __init__(self, path: str, use_db: bool):
+        self.path = path
+        self.use_db = use_db
+        self.version = 0
+        self._stopwords: FrozenSet[str] = frozenset()
+        self._db_words: FrozenSet[str] = frozenset()
+        self._signature: Optional[Tuple] = None
+        self._repository: Optional[StopwordsRepository] = None
+        self._repository_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _file_signature(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _db_version(self) -> Optional[int]:
+        if not self.use_db:
+            return None
+        try:
+            # fork된 워커 프로세스는 부모의 연결을 쓰지 않고 새로 연결
+            if self._repository is None or self._repository_pid != os.getpid():
+                self._repository = StopwordsRepository(connect())
+                self._repository_pid = os.getpid()
+            return self._repository.get_stopwords_version()
+        except Exception as e:
+            logger.warning(f"[tokenizer_registry.py] DB 불용어 버전 확인 실패, 기존 불용어 사용: {e}")
+            self._repository = None
+            return self._signature[1] if self._signature is not None else None
+
+    def _read_db_words(self, db_version: Optional[int]) -> FrozenSet[str]:
+        if db_version is None or self._repository is None:
+            return self._db_words
+        try:
+            return frozenset(self._repository.get_stopword_words())
+        except Exception as e:
+            logger.warning(f"[tokenizer_registry.py] DB 불용어 조회 실패, 기존 불용어 사용: {e}")
+            return self._db_words
+
+    def get(self) -> FrozenSet[str]:
+        return self.snapshot()[0]
+
+    def snapshot(self) -> Tuple[FrozenSet[str], int]:
+        """
+        불용어와 그 불용어를 읽었을 때의 version을 함께 반환합니다.
+        """
+        with self._lock:
+            signature = (self._file_signature(), self._db_version())
+            if signature != self._signature:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    file_words = frozenset(f.read().splitlines())
+                if self._signature is None or signature[1] != self._signature[1]:
+                    self._db_words = self._read_db_words(signature[1])
+                self._stopwords = file_words | self._db_words
+                self._signature = signature
+                self.version += 1
+                logger.info(f"[tokenizer_registry.py] 불용어 {len(self._stopwords)}개 로딩 "
+                            f"(파일 {len(file_words)}개, DB {len(self._db_words)}개, version: {self.version})")
+            return self._stopwords, self.version
+
+
+_stopword_registry = StopwordRegistry(stopwords_file, db_stopwords_enabled)
+
+
+def get_stopwords() -> FrozenSet[str]:
+    return _stopword_registry.get()
+
+
+def get_stopwords_snapshot() -> Tuple[FrozenSet[str], int]:
+    return _stopword_registry.snapshot()
+
+
+class WordAnalysisCache:
+    """
+    공백 단위 단어 -> 불용어를 제외한 분석 결과를 저장하는 LRU 캐시
+    용량(capacity)을 넘으면 가장 오래 사용하지 않은 단어부터 삭제합니다.
+
+    단어를 따로 분석하는 word 모드에서만 사용합니다. batch 모드는 분할 전체를 문맥과 함께 분석하므로
+    단어 단위 결과를 재사용할 수 없습니다. (config.tokenize_mode 기본값은 batch)
+
+    분석 결과는 불용어 사전에 따라 달라지므로 항목마다 분석할 때의 불용어 version을 기록하고,
+    version이 다른 항목은 조회하지 않습니다. 새 version으로 validate()하면 전체를 비우며,
+    그 뒤에 이전 version의 불용어로 분석한 결과는 저장하지 않습니다.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.stopwords_version = -1
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validate(self, version: int):
+        # 불용어 version은 증가만 하므로 늦게 도착한 이전 version으로는 되돌리지 않음
+        if version > self.stopwords_version:
+            with self._lock:
+                if version > self.stopwords_version:
+                    self._entries.clear()
+                    self.stopwords_version = version
+
+    def get(self, word: str, version: int) -> Optional[Tuple]:
+        with self._lock:
+            entry = self._entries.get(word)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(word)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, word: str, analyzed: Tuple, version: int):
+        with self._lock:
+            if version != self.stopwords_version:
+                return
+            self._entries[word] = (version, analyzed)
+            self._entries.move_to_end(word)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+_word_cache = WordAnalysisCache(word_cache_capacity) if word_cache_enabled else None
+
+
+def get_word_cache(version: int) -> Optional[WordAnalysisCache]:
+    """
+    불용어 version 기준으로 갱신한 단어 분석 캐시를 반환합니다. 사용하지 않으면 None
+    """
+    if _word_cache is not None:
+        _word_cache.validate(version)
+    return _word_cache
+
+
+def warm_up():
+    """
+    앱 시작 시 Kiwi와 불용어를 미리 불러와 첫 요청의 지연을 없앱니다.
+    """
+    get_kiwi().tokenize("형태소 분석기 준비")
+    get_stopwords()
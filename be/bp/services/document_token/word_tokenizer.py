@@ -1,10 +1,15 @@
-from typing import List, Literal, Dict
+from typing import List, Literal, Dict, Optional, Tuple, Iterator
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import time
 
-from kiwipiepy import Kiwi
-
-from bp.views.tokens import Token, SegmentTokens
-from config import stopwords_file
+from bp.views.tokens import SegmentTokens
+from bp.services.document_token.token_buffer import TokenBuffer
+from bp.services.document_token.tokenizer_registry import get_kiwi, get_stopwords_snapshot, get_word_cache
+from bp.services.document_token.pii_scanner import PiiMatch, PII_TAG, scan_segments, group_matches_by_word
 from bp.utils.loggers import setup_logger
+from config import tokenize_mode, tokenize_workers
 
 logger = setup_logger()
 pos_tag_dict = {
@@ -41,100 +46,278 @@ stopwords = set([
     'JX',  # 보조사
     'JC'   # 접속 조사
 ])
-# 개인정보 태그 딕셔너리
-personal_information_tag_dict = {
-    "W_EMAIL": "이메일 주소",       # 이메일 주소
-    "W_SERIAL": "일련번호(전화번호, 통장번호, IP주소 등)",  # 일련번호 (전화번호, IP 등)
-}
+
+
+def _word_starts(words: List[str]) -> List[int]:
+    """
+    공백(' ')으로 나눈 단어들의 분할 내 시작 위치
+    """
+    word_starts = []
+    offset = 0
+    for word in words:
+        word_starts.append(offset)
+        offset += len(word) + 1
+    return word_starts
 
 
 class WordTokenizer:
     """
     1. 일반명사, 고유명사, 용언 추출
     2. 기본 불용어 사전으로 불용어 제거
+    3. 형태소 분석 전에 개인정보(이메일, 전화번호, 주민등록번호, 계좌번호, IP)를 찾아 하나의 토큰으로 유지
+    Kiwi와 불용어 사전은 tokenizer_registry에서 프로세스 단위로 공유합니다.
     """
     
-    def __init__(self, segments: List[str], lang: Literal['kor', 'eng']):
+    def __init__(self, segments: List[str], lang: Literal['kor', 'eng'],
+                 mode: Literal['batch', 'word'] = tokenize_mode, workers: int = tokenize_workers):
+        start = time.perf_counter()
         self.segments = segments
-        self.kiwi = Kiwi()
+        self.mode = mode  # batch: 분할 단위로 Kiwi에 전달, word: 단어마다 Kiwi 호출
+        self.workers = workers  # 2 이상이면 분할들을 스레드 풀에서 동시에 토큰화
+        self.kiwi = get_kiwi()
         self.lang = lang
-        self.stopword = self._make_stopword_set()
+        self.stopword, self.stopwords_version = get_stopwords_snapshot()
+        # 단어별 분석 결과 LRU 캐시 (word 모드에서만 사용, 그 외에는 None)
+        self.word_cache = get_word_cache(self.stopwords_version) if mode == 'word' else None
         self.token_positions = {}  # {token: 마지막 등장 인덱스} 저장
+        self.buffer = TokenBuffer(lang)  # 토큰은 pydantic 모델 대신 열 단위 배열에 저장
+        self.setup_seconds = time.perf_counter() - start
+        logger.info(f"[word_tokenizer.py] 토크나이저 준비 ({self.setup_seconds * 1000:.2f}ms)")
 
     def tokenization(self) -> List[SegmentTokens]:
-        
+        """
+        분할별 토큰을 pydantic 모델(SegmentTokens)로 반환합니다. (API 응답 등 경계에서 사용)
+        """
+        return self.tokenization_buffer().to_segment_tokens()
+
+    def tokenization_buffer(self) -> TokenBuffer:
+        """
+        문서 전체 토큰을 열 단위 TokenBuffer로 반환합니다. (내부 처리용)
+        """
         if self.lang == 'kor': 
-            tokens = self.tokenization_kor()
+            self.tokenization_kor()
         # elif self.lang == 'eng':
-        #     tokens = self.tokenization_eng()
+        #     self.tokenization_eng()
         else: 
             raise ValueError(f"Not supported language: {self.lang}")
         
-        return tokens
-    
-    def _make_stopword_set(self) -> set[str]:
+        return self.buffer
+
+    def iter_tokenization(self) -> Iterator[TokenBuffer]:
         """
-        기본 불용어 사전 제작
+        분할을 하나씩 토큰화하면서 그 분할의 토큰만 담은 TokenBuffer를 바로 내보냅니다.
+        문서 전체 토큰을 메모리에 모아 두지 않으므로 통계 단계에서 분할마다 바로 집계할 수 있습니다.
         """
-        with open(stopwords_file, 'r', encoding='utf-8') as f:
-            stopwords = set(f.read().splitlines())  # 불용어를 집합(set)으로 저장
-        return stopwords
+        if self.lang == 'kor': 
+            yield from self._iter_tokenize_kor(buffer_per_segment=True)
+        else: 
+            raise ValueError(f"Not supported language: {self.lang}")
     
-    def _tokenize_seg(self, start_index: int, seg: str, seg_id: int) -> SegmentTokens: 
-        
+    def _classify(self, t) -> Optional[Tuple[str, str, Optional[str]]]:
+        """
+        형태소 하나를 (단어, 태그, 개인정보 유형)으로 분류합니다. 불용어이면 None
+        개인정보는 형태소 분석 전에 pii_scanner에서 찾으므로 여기서는 다루지 않습니다.
+        """
+        # 불용어 제거
+        if t.form in self.stopword: return None
+
+        if t.tag not in stopwords: 
+            return t.form, t.tag, None
+        else:
+            return t.form, "기타", None
+
+    def _merge_pii(self, morphs, matches: List[PiiMatch]) -> Iterator[Tuple[int, Tuple[str, str, Optional[str]]]]:
+        """
+        형태소와 개인정보 매치를 위치 순서대로 합쳐 (시작 위치, 분류 결과)를 내보냅니다.
+        개인정보 구간에 걸친 형태소는 버리고, 매치 하나를 "개인 정보" 토큰 하나로 만듭니다.
+        """
+        match_starts = [match.start for match in matches]
+        next_match = 0
+        for t in morphs:
+            while next_match < len(matches) and matches[next_match].start <= t.start:
+                match = matches[next_match]
+                yield match.start, (match.text, PII_TAG, match.pii_type)
+                next_match += 1
+            j = bisect_right(match_starts, t.start + t.len - 1) - 1
+            if j >= 0 and matches[j].end > t.start:
+                continue
+            analyzed = self._classify(t)
+            if analyzed is not None:
+                yield t.start, analyzed
+        for match in matches[next_match:]:
+            yield match.start, (match.text, PII_TAG, match.pii_type)
+
+    def _record_positions(self, buffer: TokenBuffer, start: int):
+        """
+        버퍼의 start 이후 토큰으로 단어별 마지막 등장 인덱스를 갱신합니다. (분할 순서대로 호출)
+        """
+        vocab = buffer.vocab
+        for i in range(start, len(buffer)):
+            self.token_positions[vocab[buffer.word_ids[i]]] = buffer.indices[i]
+
+    def _analyze_word(self, word: str) -> Tuple[Tuple[str, str, Optional[str]], ...]:
+        """
+        공백 단위 단어 하나의 분석 결과(불용어 제외)를 반환합니다. 캐시에 있으면 Kiwi를 호출하지 않습니다.
+        """
+        if self.word_cache is not None:
+            analyzed = self.word_cache.get(word, self.stopwords_version)
+            if analyzed is not None:
+                return analyzed
+
+        analyzed = tuple(a for a in map(self._classify, self.kiwi.tokenize(word)) if a is not None)
+        if self.word_cache is not None:
+            self.word_cache.put(word, analyzed, self.stopwords_version)
+        return analyzed
+
+    def _tokenize_seg(self, buffer: TokenBuffer, start_index: int, seg: str, seg_id: int,
+                      pii_matches: List[PiiMatch]) -> int: 
+        """
+        분할의 단어마다 형태소 분석하여 버퍼에 추가하고, 다음 단어 인덱스를 반환합니다.
+        개인정보가 있는 단어는 캐시를 쓰지 않고 개인정보 토큰과 나머지 형태소를 합쳐 추가합니다.
+        """
         words = seg.split(' ')
+        pii_by_word = group_matches_by_word(pii_matches, _word_starts(words)) if pii_matches else {}
 
         index = start_index # 단어 인덱스
-        seg_tokens=[]
-        for word in words: 
-            tokens = self.kiwi.tokenize(word)
-            for t in tokens:
-                # 불용어 제거
-                if t.form in self.stopword: continue 
-    
-                self.token_positions[t.form] = index
-                    
-                if t.tag not in stopwords: 
-                    s_t = Token(idx=index, word=t.form, tag=t.tag, lang=self.lang, seg_id=seg_id)
-                    seg_tokens.append(s_t)
-                elif t.tag in personal_information_tag_dict.keys(): # 개인정보 추출
-                    s_t = Token(idx=index, word=t.form, tag="개인 정보", lang=self.lang, seg_id=seg_id, personal_infromation=personal_information_tag_dict[t.tag])
-                    seg_tokens.append(s_t)
-                else:
-                    s_t = Token(idx=index, word=t.form, tag="기타", lang=self.lang, seg_id=seg_id)
-                    seg_tokens.append(s_t)
+        for position, word in enumerate(words): 
+            if position in pii_by_word:
+                analyzed_list = (analyzed for _, analyzed in self._merge_pii(self.kiwi.tokenize(word), pii_by_word[position]))
+            else:
+                analyzed_list = self._analyze_word(word)
+            for word_form, tag, pii_type in analyzed_list:
+                buffer.append(word_form, tag, pii_type, index, seg_id)
                     
             index+=1
 
-        return SegmentTokens(segment_tokens=seg_tokens), index
-    
+        return index
 
+    def _tokenize_seg_morphs(self, buffer: TokenBuffer, start_index: int, seg: str, seg_id: int, morphs,
+                             pii_matches: List[PiiMatch]) -> int:
+        """
+        분할 전체를 분석한 형태소를 공백 기준 단어 인덱스로 되돌려 버퍼에 추가합니다.
+        형태소의 시작 위치(t.start)가 속한 단어를 이진 탐색으로 찾으므로 idx는 단어별 분석과 같은 기준입니다.
+        """
+        words = seg.split(' ')
+        word_starts = _word_starts(words)
+
+        if pii_matches:
+            for start, (word_form, tag, pii_type) in self._merge_pii(morphs, pii_matches):
+                buffer.append(word_form, tag, pii_type, start_index + bisect_right(word_starts, start) - 1, seg_id)
+        else:
+            for t in morphs:
+                analyzed = self._classify(t)
+                if analyzed is not None:
+                    word_form, tag, pii_type = analyzed
+                    buffer.append(word_form, tag, pii_type, start_index + bisect_right(word_starts, t.start) - 1, seg_id)
 
-    def tokenization_kor(self) -> List[SegmentTokens]:
+        return start_index + len(words)
+
+    def tokenization_kor(self) -> TokenBuffer:
         """
         한국어 문장을 형태소 분석하고, 명사(Noun), 형용사, 동사(Verb), 개인정보보 토큰만 추출하는 함수
-        :return: 문장과 해당 문장의 토큰 정보를 포함하는 리스트
-        예시:
+        :return: 분할별 토큰이 담긴 TokenBuffer
+        예시 (to_segment_tokens() 결과):
         [{'sentence': "'Google DeepMind 는  AI 분야를 선도하고 있습니다.'", 
         'tokens': [
             {'word': '분야', 'tag': 'noun', 'lang': 'kor', 'seg_id': 1, 'gap': 0}, 
             {'word': '선도', 'tag': 'noun', 'lang': 'kor', 'seg_id': 1, 'gap': 0}]}
         """
         
-        doc_tokens = []
+        for _ in self._iter_tokenize_kor(buffer_per_segment=False):
+            pass
+        return self.buffer
+
+    def _iter_tokenize_kor(self, buffer_per_segment: bool) -> Iterator[TokenBuffer]:
+        """
+        분할마다 토큰화를 마치면 self.buffer를 내보냅니다.
+        buffer_per_segment이면 분할마다 새 버퍼를 쓰고, 아니면 하나의 버퍼에 문서 전체를 모읍니다.
+        """
+        token_count = 0
+        seg_count = 0
+        logger.info(f"[word_tokenizer.py] 문서 토큰화 시작 (workers: {self.workers})")
+
+        if self.workers > 1:
+            segment_buffers = self._iter_parallel_segment_buffers()
+        else:
+            segment_buffers = self._iter_serial_segment_buffers(None if buffer_per_segment else self.buffer)
+
+        for segment_buffer in segment_buffers:
+            if buffer_per_segment:
+                self.buffer = segment_buffer
+            elif segment_buffer is not self.buffer:
+                self.buffer.extend(segment_buffer)
+            segment_start = self.buffer.segment_offsets[-2]
+            self._record_positions(self.buffer, segment_start)
+            token_count += len(self.buffer) - segment_start
+            seg_count += 1
+            yield self.buffer
+        logger.info(f"[word_tokenizer.py] 문서 토큰화 완료. {seg_count}개 분할, {token_count}개 토큰 생성")
+        if self.word_cache is not None:
+            logger.info(f"[word_tokenizer.py] 단어 분석 캐시 {self.word_cache.stats()}")
+
+    def _iter_serial_segment_buffers(self, target: Optional[TokenBuffer]) -> Iterator[TokenBuffer]:
+        """
+        분할을 순서대로 토큰화합니다. target이 있으면 그 버퍼에 이어 쓰고, 없으면 분할마다 새 버퍼를 만듭니다.
+        """
         seg_i = 1 # 분할 index는 1부터 시작
         start_index = 0 # 단어의 index
-        logger.info(f"[word_tokenizer.py] 문서 토큰화 시작")
 
-        for seg in self.segments:
-            seg_tokens, index = self._tokenize_seg(start_index, seg, seg_i)
+        # 형태소 분석 전에 문서 전체 분할에서 개인정보를 한 번에 찾음
+        pii_matches_list = scan_segments(self.segments)
+
+        if self.mode == 'batch':
+            # 분할 목록을 한 번에 넘기면 Kiwi가 내부 스레드로 분석하고 입력 순서대로 결과를 돌려줌
+            morphs_list = self.kiwi.tokenize(self.segments)
+        else:
+            morphs_list = (None for _ in self.segments)
+
+        for seg, morphs, pii_matches in zip(self.segments, morphs_list, pii_matches_list):
+            buffer = target if target is not None else TokenBuffer(self.lang)
+            if morphs is None:
+                index = self._tokenize_seg(buffer, start_index, seg, seg_i, pii_matches)
+            else:
+                index = self._tokenize_seg_morphs(buffer, start_index, seg, seg_i, morphs, pii_matches)
+            buffer.end_segment()
+            yield buffer
             start_index = index+1
-            doc_tokens.append(seg_tokens)           
             seg_i+=1
-        logger.info(f"[word_tokenizer.py] 문서 토큰화 완료. {len(doc_tokens)}개의 문서 토큰 생성")
 
-        
-        return doc_tokens
+    def _segment_start_indices(self) -> List[int]:
+        """
+        분할별 시작 단어 인덱스. 순차 처리와 같이 다음 분할은 (이전 시작 + 단어 수 + 1)에서 시작합니다.
+        """
+        start_indices = []
+        start_index = 0
+        for seg in self.segments:
+            start_indices.append(start_index)
+            start_index += seg.count(' ') + 2  # 단어 수(len(seg.split(' '))) + 1
+        return start_indices
+
+    def _tokenize_segment_task(self, seg: str, start_index: int, seg_id: int, pii_matches: List[PiiMatch]) -> TokenBuffer:
+        buffer = TokenBuffer(self.lang)
+        if self.mode == 'batch':
+            self._tokenize_seg_morphs(buffer, start_index, seg, seg_id, self.kiwi.tokenize(seg), pii_matches)
+        else:
+            self._tokenize_seg(buffer, start_index, seg, seg_id, pii_matches)
+        buffer.end_segment()
+        return buffer
+
+    def _iter_parallel_segment_buffers(self) -> Iterator[TokenBuffer]:
+        """
+        분할별 시작 인덱스를 먼저 계산한 뒤 분할들을 스레드 풀에서 동시에 토큰화하고, 분할 순서대로 내보냅니다.
+        메모리를 제한하기 위해 아직 내보내지 않은 분할은 workers * 2개까지만 미리 처리합니다.
+        """
+        start_indices = self._segment_start_indices()
+        pii_matches_list = scan_segments(self.segments)
+        tasks = iter(enumerate(zip(self.segments, start_indices, pii_matches_list), start=1))
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tokenizer") as executor:
+            for seg_id, (seg, start_index, pii_matches) in tasks:
+                pending.append(executor.submit(self._tokenize_segment_task, seg, start_index, seg_id, pii_matches))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
      
 
     
@@ -142,12 +325,58 @@ if __name__=='__main__':
     segments_kor = [
         """Google은 AI 분야를 선도하고, 또 선도하고, 계속 선도하고 있습니다.""",
         """Google은 AI 분야를 선도하고, 또 선도하고, 계속 선도하고 있습니다.""",
-        """Google은 AI 분야를 선도하고, 또 선도하고, 계속 선도하고 있습니다."""
+        """Google은 AI 분야를 선도하고, 또 선도하고, 계속 선도하고 있습니다.""",
+        """문의: hong.gd@example.co.kr 또는 010-1234-5678로 연락 바랍니다."""
     ]
     
     wt = WordTokenizer(segments_kor, 'kor')
     result = wt.tokenization()
     print(result)
+
+    # 벤치마크: 단어별 호출(word) vs 분할 단위 일괄 분석(batch)
+    bench_segments = [
+        "Google DeepMind는 인공지능 분야를 선도하고 있으며, 연구 결과를 논문과 보고서로 공개하고 있습니다. " * 20
+    ] * 200
+    results = {}
+    for mode in ('word', 'batch'):
+        start = time.perf_counter()
+        buffer = WordTokenizer(bench_segments, 'kor', mode=mode).tokenization_buffer()
+        elapsed = time.perf_counter() - start
+        results[mode] = [(idx, word, tag) for word, tag, _, idx, _ in buffer.iter_rows()]
+        print(f"{mode}: {elapsed:.2f}s, 토큰 {len(results[mode])}개")
+
+    word_keys, batch_keys = set(results['word']), set(results['batch'])
+    same_ratio = len(word_keys & batch_keys) / max(1, len(word_keys | batch_keys))
+    print(f"(idx, word, tag) 일치 비율: {same_ratio:.3f}")
+
+    # 분할 병렬 토큰화 처리 시간 (결과 일치 여부는 tests/test_word_tokenizer.py)
+    for mode in ('word', 'batch'):
+        for workers in (1, 4):
+            start = time.perf_counter()
+            WordTokenizer(bench_segments, 'kor', mode=mode, workers=workers).tokenization_buffer()
+            print(f"{mode} (workers: {workers}): {time.perf_counter() - start:.2f}s")
+
+    # 메모리/생성 시간: 열 단위 TokenBuffer vs 토큰별 pydantic 모델
+    import tracemalloc
+
+    def _copy_buffer(rows) -> TokenBuffer:
+        copied = TokenBuffer('kor')
+        for word, tag, pii_type, index, seg_id in rows:
+            copied.append(word, tag, pii_type, index, seg_id)
+        copied.end_segment()
+        return copied
+
+    buffer = WordTokenizer(bench_segments, 'kor').tokenization_buffer()
+    rows = list(buffer.iter_rows())
+    for name, build in (('pydantic', buffer.to_segment_tokens), ('buffer', lambda: _copy_buffer(rows))):
+        tracemalloc.start()
+        start = time.perf_counter()
+        built = build()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name}: {elapsed:.3f}s, peak {peak / 1024 / 1024:.1f}MB ({len(rows)} tokens)")
+        del built
     
     # sentence_data = {
     #     "sentence": "저는 키위를 좋아하는 형태소 분석기 키위입니다.",
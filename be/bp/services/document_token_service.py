@@ -1,4 +1,5 @@
 from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 import pandas as pd
 import os
@@ -6,19 +7,68 @@ import os
 from bp.services.document_token.input_data import input_data
 from bp.services.document_token.document_parsor import DocumentParser
 from bp.services.document_token.word_tokenizer import WordTokenizer
-from bp.services.document_token.analysis_document import compute_token_stats_by_word, enrich_token_frequencies
+from bp.services.document_token.analysis_document import compute_token_stats_streaming, compute_document_statistics
 from bp.views.document_token import DocumentToken, DocumentTokenDB
 from bp.repositories.document_token_repository import DocumentTokenRepository
+from bp.repositories.document_statistics_repository import DocumentStatisticsRepository
 from bp.services.document_token.input_data import input_data
 from bp.utils.loggers import setup_logger
 from bp.services.dictionary_service import DictionaryService
+from config import ingest_workers
 
 logger = setup_logger()
 
+
+def tokenize_document(file_path: str, lang: str, name: str, cate1: str, cate2: str) -> List[DocumentToken]:
+    """
+    문서 하나를 파싱 → 토큰화 → 단어 분석까지 수행합니다.
+    DB 연결을 사용하지 않으므로 여러 스레드에서 동시에 실행할 수 있습니다. (_create_document_token_parallel)
+
+    file_path: 문서 경로
+    lang: kor or eng
+    name, cate1, cate2: 메타데이터
+    """
+    logger.info(f"Start tokenizing document: {file_path}")
+    # 1. 문서를 분할별로 파싱
+    parsor = DocumentParser(file_path)
+    segs = parsor.parse_doc_to_seg()
+    logger.info(f"[document_token_service.py] 분할 개수: {len(segs)}")
+
+    # Seg 데이터를 JSON 파일로 저장
+    seg_file_path = f"segs/{os.path.basename(file_path)}.json"
+    os.makedirs(os.path.dirname(seg_file_path), exist_ok=True)
+    with open(seg_file_path, "w", encoding="utf-8") as seg_file:
+        json.dump(segs, seg_file, ensure_ascii=False, indent=4)
+
+    # 분할별 페이지 범위와 문자 위치 (UI 하이라이트용)
+    span_file_path = f"segs/{os.path.basename(file_path)}.spans.json"
+    with open(span_file_path, "w", encoding="utf-8") as span_file:
+        json.dump([segment.model_dump(exclude={'text'}) for segment in parsor.segments], span_file, ensure_ascii=False, indent=4)
+
+    # 페이지별 파싱 strategy (adaptive일 때 fast/hi_res, 그 외에는 빈 dict). 캐시를 사용한 경우에도 같은 값
+    strategy_file_path = f"segs/{os.path.basename(file_path)}.strategies.json"
+    with open(strategy_file_path, "w", encoding="utf-8") as strategy_file:
+        json.dump(parsor.page_strategies, strategy_file, ensure_ascii=False, indent=4)
+
+    # 2. 분할을 토큰화하면서 3. 분할 단위로 바로 단어 분석
+    tokenizer = WordTokenizer(segs, lang)
+    document_token_list = compute_token_stats_streaming(tokenizer.iter_tokenization(), name, file_path, cate1, cate2)
+    logger.info(f"[document_token_service.py] 문서의 토큰 테이블 개수: {len(document_token_list)}")
+
+    return document_token_list
+
+
 class DocumentParsingService:
     def __init__(self):
         self.document_token_repository = DocumentTokenRepository()
+        self.document_statistics_repository = DocumentStatisticsRepository()
         self.dictionary_service = DictionaryService()
+        self.failed_documents: List[Dict] = []  # 적재에 실패한 문서와 사유
+
+    def _record_failure(self, file_path: str, error: Exception):
+        reason = f"{type(error).__name__}: {error}"
+        logger.error(f"[document_token_service.py] 문서 {file_path} 적재 실패: {reason}")
+        self.failed_documents.append({'file_path': file_path, 'reason': reason})
 
     def _convert_to_db_model(self, token: DocumentToken) -> DocumentTokenDB:
         return DocumentTokenDB(
@@ -64,7 +114,14 @@ class DocumentParsingService:
             index=token.index
         )
     
-    def create_document_token(self, lang, metadata) -> Tuple[int, int]:
+    def create_document_token(self, lang, metadata, workers: int = None) -> Tuple[int, int, List[str]]:
+        """
+        메타데이터 한 행(cate1 폴더)의 문서들을 파싱/토큰화하여 DB에 적재합니다.
+
+        workers: 동시에 처리하는 문서 수. None이면 config.ingest_workers를 사용하고,
+                 1 이하이면 순차 처리합니다.
+        실패한 문서는 건너뛰고 self.failed_documents에 사유와 함께 기록합니다.
+        """
         logger.info(f"Start creating document token: {metadata['file_loc']}")
 
         name = metadata["file_loc"]
@@ -82,52 +139,69 @@ class DocumentParsingService:
         # /data/ 이후의 경로만 추출
         logger.info(f"{file_dir}에서 찾은 문서 개수: {len(file_path_list)}")
 
-        row_counts = []
-        for file_path in file_path_list:
-            document_token_list = self._tokenize_document(file_path, lang, name, cate1, cate2)
-        
-            row_count = self.document_token_repository.insert_all_document_tokens(document_token_list)
-
-            # # 전체 문서 내 토큰 테이블 수치 업데이트
-            # all_document_tokens = self.document_token_repository.select_all_tokens()
-            # all_document_tokens_update = enrich_token_frequencies(all_document_tokens)
-            
-            # row_count = self.document_token_repository.update_token_counts(all_document_tokens_update)
-            row_counts.append(row_count)
+        workers = ingest_workers if workers is None else workers
+        if workers > 1 and len(file_path_list) > 1:
+            row_counts = self._create_document_token_parallel(file_path_list, lang, name, cate1, cate2, workers)
+        else:
+            row_counts = []
+            for file_path in file_path_list:
+                try:
+                    document_token_list = self._tokenize_document(file_path, lang, name, cate1, cate2)
+                
+                    row_count = self.document_token_repository.insert_all_document_tokens(document_token_list)
+                except Exception as e:
+                    self._record_failure(file_path, e)
+                    continue
+                row_counts.append(row_count)
+                self._save_ingested_statistics(file_path)
 
         return len(row_counts), sum(row_counts), file_path_list
+
+    def _create_document_token_parallel(self, file_path_list: List[str], lang: str, name: str,
+                                        cate1: str, cate2: str, workers: int) -> List[int]:
+        """
+        문서별 파싱/토큰화를 스레드로 동시에 실행하고, 끝나는 순서대로 현재 스레드(단일 writer)에서 DB에 적재합니다.
+        한 문서가 실패해도 나머지 문서의 처리는 계속됩니다.
+
+        프로세스 풀이 아니라 스레드 풀을 사용합니다.
+        - PDF 파싱은 DocumentParser가 프로세스 전체에서 공유하는 파서 워커 풀(get_parser_pool)로 보내므로
+          문서별 시간/메모리 제한과 CPU 스레드 예산은 파서 풀 설정을 따르고, 업로드마다 워커와 모델을 새로 띄우지 않음
+          (적재용 프로세스 풀을 두면 각 프로세스가 파서 풀 없이 직접 파싱하게 됨)
+        - Kiwi 형태소 분석은 네이티브 코드에서 자체 스레드(kiwi_num_workers)로 실행
+        - 나머지 토큰화/통계 계산(분할 조립, 개인정보 탐지, 토큰 테이블 행 생성)과 docx/pptx/xml 파싱은
+          이 프로세스에서 GIL을 공유하므로 문서 수만큼 빨라지지는 않음
+        """
+        workers = min(workers, len(file_path_list))
+        logger.info(f"[document_token_service.py] 병렬 적재 시작 (workers: {workers})")
+
+        row_counts = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest") as executor:
+            futures = {
+                executor.submit(tokenize_document, file_path, lang, name, cate1, cate2): file_path
+                for file_path in file_path_list
+            }
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    document_token_list = future.result()
+                    row_count = self.document_token_repository.insert_all_document_tokens(document_token_list)
+                except Exception as e:
+                    self._record_failure(file_path, e)
+                    continue
+                row_counts.append(row_count)
+                self._save_ingested_statistics(file_path)
+
+        return row_counts
         
     def _tokenize_document(self, file_path:str, lang: str, name: str, cate1:str, cate2:str) -> List[DocumentToken]:
         """
-        path: 폴더 디렉토리
+        순차 적재에서 문서 하나를 현재 스레드에서 토큰화합니다. (PDF 파싱은 파서 워커 풀에서 실행)
+
+        file_path: 문서 경로
         lang: kor or eng
-        metadata: source, platform, cate1, cate2, file_loc, url
+        name, cate1, cate2: 메타데이터
         """
-        
-        tokens_per_file = []
-        logger.info(f"Start tokenizing document: {file_path}")
-        # 1. 문서를 분할별로 파싱
-        parsor = DocumentParser(file_path)
-        segs = parsor.parse_doc_to_seg()
-        logger.info(f"[document_token_service.py] 분할 개수: {len(segs)}")
-
-        # Seg 데이터를 JSON 파일로 저장
-        seg_file_path = f"segs/{os.path.basename(file_path)}.json"
-        os.makedirs(os.path.dirname(seg_file_path), exist_ok=True)
-        with open(seg_file_path, "w", encoding="utf-8") as seg_file:
-            json.dump(segs, seg_file, ensure_ascii=False, indent=4)
-
-        # 2. 분할을 토큰화
-        tokenizer = WordTokenizer(segs, lang)
-        tokens = tokenizer.tokenization()
-        tokens_per_file.append(tokens)
-        logger.info(f"[document_token_service.py] 문서의 토큰 개수: {len(tokens)}")
-
-        # 3. 단어 분석
-        document_token_list = compute_token_stats_by_word(tokens_per_file, name, file_path, cate1, cate2)
-        logger.info(f"[document_token_service.py] 문서의 토큰 테이블 개수: {len(document_token_list)}")
-
-        return document_token_list
+        return tokenize_document(file_path, lang, name, cate1, cate2)
     
     def get_segmented_tokens(self, file_path: str) -> List[dict]:
         """
@@ -227,134 +301,73 @@ class DocumentParsingService:
             logger.error(f"단어 정보 조회 중 오류 발생: {str(e)}")
             raise
 
-    def get_document_statistics(self, file_path: str) -> Dict:
-        try:
-            # 1. DocumentToken 데이터베이스에서 조회
-            document_tokens = self.document_token_repository.get_tokens_by_document_path(file_path)
-            if not document_tokens:
-                return {
-                    "success": True,
-                    "statistics": {
-                        "total_words": 0,
-                        "word_types": {},
-                        "word_statistics": {},
-                        "overall_statistics": {
-                            "average": 0,
-                            "std_dev": 0
-                        }
-                    }
-                }
-
-            # 2. DataFrame 생성 (기타 단어 제외)
-            df = pd.DataFrame([{
-                'word': token.value,
-                'word_type': token.word_type,
-                'col_id': token.col_id,
-                'col_cnt': token.col_cnt or 0,
-                'total_cnt': token.total_cnt or 0,
-                'cate1_cnt': token.cate1_cnt or 0,
-                'cate2_cnt': token.cate2_cnt or 0,
-                'doc_cnt': token.doc_cnt or 0,
-                'cate1': token.cate1,
-                'cate2': token.cate2
-            } for token in document_tokens if token.word_type != '기타'])
-
-            if len(df) == 0:
-                return {
-                    "success": True,
-                    "statistics": {
-                        "total_words": 0,
-                        "word_types": {},
-                        "word_statistics": {},
-                        "overall_statistics": {
-                            "average": 0,
-                            "std_dev": 0
-                        }
-                    }
-                }
-
-            # 3. 기본 통계 계산
-            statistics = {
-                "total_words": int(len(df)),
-                "word_types": df['word_type'].value_counts().to_dict(),
-                "word_statistics": {},
-                "overall_statistics": {}
+    def refresh_document_statistics(self, file_path: str, data_version: str = None) -> Dict:
+        """
+        DB에 있는 문서 토큰으로 통계를 계산해 document_statistics에 데이터 버전과 함께 저장합니다.
+        데이터 버전은 문서의 전체 행을 기준으로 하므로, 같은 문서를 다시 적재해 이전 행이 남아 있어도
+        통계는 버전이 가리키는 행 전체로 계산합니다.
+        토큰이 없는 경로(없는 문서, 오타)는 빈 통계를 반환하고 스냅샷을 저장하지 않습니다.
+        """
+        if data_version is None:
+            data_version = self.document_token_repository.get_document_data_version(file_path)
+        document_tokens = self.document_token_repository.get_tokens_by_document_path(file_path)
+        if not document_tokens:
+            return self._build_document_statistics(document_tokens)
+
+        statistics = self._build_document_statistics(document_tokens)
+        self.document_statistics_repository.save_snapshot(file_path, data_version, statistics)
+        return statistics
+
+    def _build_document_statistics(self, document_tokens: List[DocumentToken]) -> Dict:
+        empty_statistics = {
+            "total_words": 0,
+            "word_types": {},
+            "word_statistics": {},
+            "overall_statistics": {
+                "average": 0,
+                "std_dev": 0
             }
+        }
+        if not document_tokens:
+            return empty_statistics
+
+        # DataFrame 생성 (기타 단어 제외)
+        df = pd.DataFrame([{
+            'word': token.value,
+            'word_type': token.word_type,
+            'col_id': token.col_id,
+            'col_cnt': token.col_cnt or 0,
+            'cate1': token.cate1,
+            'cate2': token.cate2
+        } for token in document_tokens if token.word_type != '기타'])
+
+        if len(df) == 0:
+            return empty_statistics
+
+        # (단어 x 분할) 빈도표로 단어별/전체 통계를 한 번에 계산
+        return compute_document_statistics(df)
+
+    def _save_ingested_statistics(self, file_path: str):
+        """
+        적재 직후 문서 통계 스냅샷을 저장합니다. 실패해도 조회 시 다시 계산하므로 적재는 계속합니다.
+        """
+        try:
+            self.refresh_document_statistics(file_path)
+        except Exception as e:
+            logger.error(f"[document_token_service.py] 문서 {file_path} 통계 저장 실패: {e}")
 
-            # 4. 분할별 단어 빈도 계산 및 데이터베이스 업데이트
-            updated_tokens = []
-            
-            # 모든 분할의 고유 ID 목록
-            all_col_ids = sorted(df['col_id'].unique())
-            
-            # 전체 단어의 빈도 데이터를 저장하기 위한 리스트
-            all_word_frequencies = []
-            
-            # 각 단어별로 분할별 빈도 계산
-            for word, word_group in df.groupby('word'):
-                # 각 분할별 빈도 계산
-                frequencies = word_group.groupby('col_id')['col_cnt'].sum()
-                
-                # 모든 분할에 대해 빈도 계산 (없는 경우 0)
-                all_frequencies = pd.Series(0, index=all_col_ids)
-                all_frequencies.update(frequencies)
-                
-                # 전체 단어 빈도 데이터에 추가
-                all_word_frequencies.extend(all_frequencies.values)
-                
-                # 평균과 표준편차 계산
-                avg = float(all_frequencies.mean())
-                std_dev = float(all_frequencies.std())
-                
-                # 첫 번째 행의 정보 사용 (모든 행이 동일한 정보를 가짐)
-                first_row = word_group.iloc[0]
-                
-                # 전체 문서에서의 단어 빈도
-                total_count = int(df[df['word'] == word]['col_cnt'].sum())
-                
-                # 대분류1에서의 단어 빈도
-                cate1_count = int(df[(df['word'] == word) & (df['cate1'] == first_row['cate1'])]['col_cnt'].sum())
-                
-                # 대분류2에서의 단어 빈도
-                cate2_count = int(df[(df['word'] == word) & (df['cate2'] == first_row['cate2'])]['col_cnt'].sum())
-                
-                # 현재 문서에서의 단어 빈도
-                doc_count = int(df[df['word'] == word]['col_cnt'].sum())
-
-                # 토큰 업데이트
-                for token in document_tokens:
-                    if token.value == word:
-                        token.total_cnt = total_count
-                        token.cate1_cnt = cate1_count
-                        token.cate2_cnt = cate2_count
-                        token.doc_cnt = doc_count
-                        updated_tokens.append(token)
-                
-                # 단어 통계 정보 저장
-                statistics["word_statistics"][word] = {
-                    'average': avg,
-                    'std_dev': std_dev,
-                    'word_type': first_row['word_type'],
-                    'total_cnt': total_count,
-                    'cate1_cnt': cate1_count,
-                    'cate2_cnt': cate2_count,
-                    'doc_cnt': doc_count,
-                    'segment_frequencies': all_frequencies.to_dict()
-                }
-
-            # 5. 전체 단어 통계 계산
-            if all_word_frequencies:
-                overall_avg = float(pd.Series(all_word_frequencies).mean())
-                overall_std_dev = float(pd.Series(all_word_frequencies).std())
-                
-                statistics["overall_statistics"] = {
-                    "average": overall_avg,
-                    "std_dev": overall_std_dev
-                }
-
-            # 6. 데이터베이스 업데이트
-            if updated_tokens:
-                self.document_token_repository.update_token_counts(updated_tokens)
+    def get_document_statistics(self, file_path: str) -> Dict:
+        """
+        적재 시 저장한 통계 스냅샷을 반환합니다.
+        스냅샷이 없거나 문서 토큰이 바뀌어 데이터 버전이 다르면 다시 계산해 저장합니다.
+        """
+        try:
+            data_version = self.document_token_repository.get_document_data_version(file_path)
+            snapshot = self.document_statistics_repository.get_snapshot(file_path)
+            if snapshot is not None and snapshot[0] == data_version:
+                statistics = snapshot[1]
+            else:
+                statistics = self.refresh_document_statistics(file_path, data_version=data_version)
 
             return {
                 "success": True,
@@ -0,0 +1,13 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+
+class Segment(BaseModel):
+    """
+    문서를 Title 기준으로 나눈 하나의 분할과 원문 위치 정보를 담는 모델입니다.
+    """
+    seg_id: int = Field(..., description="문서 내 분할 인덱스 ID (1부터 시작)")
+    text: str = Field(..., description="분할 텍스트")
+    page_start: Optional[int] = Field(None, description="분할이 시작되는 페이지 번호")
+    page_end: Optional[int] = Field(None, description="분할이 끝나는 페이지 번호")
+    char_start: int = Field(..., description="문서 전체 텍스트(분할 텍스트를 이어 붙인 것) 기준 시작 위치")
+    char_end: int = Field(..., description="문서 전체 텍스트 기준 끝 위치 (미포함)")
@@ -1,7 +1,75 @@
+import os
+
 stopwords_file = 'C:/Users/dblab/parsing/docs_parsing/be/bp/services/document_token/stopwords/stopwords-ko.txt'
 
 host = 'localhost'
 port = 3306
 user = 'root'
 password = '1234'
-db_name = 'parsing'
\ No newline at end of file
+db_name = 'parsing'
+
+# 문서 적재 병렬 처리: 동시에 처리하는 문서 수 (1 이하이면 기존처럼 순차 처리)
+# 파싱은 공유 파서 워커 풀로 보내므로 동시에 파싱하는 문서 수와 스레드 수는 parser_pool_* 설정을 따름
+# 문서는 스레드로 동시에 처리하며, PDF 파싱과 Kiwi 분석 외의 토큰화/통계 계산은 한 프로세스의 GIL을 공유함
+ingest_workers = 4
+
+# 문서 파싱 결과 캐시 (파일 내용 해시 + 파서 설정 기준)
+parse_cache_enabled = True
+parse_cache_dir = 'cache/parse'
+parse_cache_max_bytes = 512 * 1024 * 1024
+
+# Image/Table 이미지 추출 (기본 off, 문서별로 DocumentParser(extract_images=True)로 사용)
+# 추출한 이미지는 내용 해시 이름으로 저장하여 중복 저장하지 않음
+extract_images = False
+image_store_dir = 'cache/images'
+
+# PDF 파싱 strategy: hi_res, fast, adaptive
+# adaptive는 페이지별 텍스트 레이어를 점검해 충분하면 fast, 스캔/이미지 위주 페이지만 hi_res로 파싱
+partition_strategy = 'hi_res'
+adaptive_min_chars = 50               # 페이지 내 최소 추출 문자 수
+adaptive_max_garbled_ratio = 0.1      # 깨진 문자 비율 상한
+adaptive_max_image_coverage = 0.5     # 이미지 면적 비율 상한
+
+# 큰 PDF는 페이지 구간으로 나누어 병렬 파싱 (shard_min_pages 미만 문서는 나누지 않음)
+shard_pages = 50
+shard_min_pages = 100
+
+# hi_res 레이아웃 모델을 미리 불러 둔 파서 워커 프로세스 풀
+# 워커당 torch/onnx 스레드 수를 제한하여 워커들이 CPU를 과점유하지 않도록 함
+parser_pool_enabled = True
+parser_pool_workers = 2
+parser_worker_threads = max(1, (os.cpu_count() or 1) // parser_pool_workers)
+
+# 파서 워커 자원 제한: 문서당 시간 제한(페이지 구간으로 나누어도 문서 전체 합계),
+# 문서당 메모리(RSS) 상한(문서를 파싱 중인 워커들의 합계), 워커 재시작 주기(문서 수)
+parse_timeout_seconds = 600
+parse_max_rss_mb = 4096
+parser_max_documents_per_worker = 20
+
+# 형태소 분석 방식: batch는 분할 단위로 Kiwi에 일괄 전달(문맥 반영), word는 공백 단위 단어마다 분석
+tokenize_mode = 'batch'
+kiwi_num_workers = -1  # Kiwi 내부 분석 스레드 수 (-1: CPU 코어 수, 0: 스레드 사용 안 함)
+tokenize_workers = 1   # 문서 하나의 분할들을 동시에 토큰화할 스레드 수 (1: 순차 처리)
+
+# word 모드에서 단어별 분석 결과를 재사용하는 LRU 캐시 (프로세스 내 문서 간 공유)
+# batch 모드(기본값)는 분할 단위로 분석하므로 이 캐시를 사용하지 않음
+word_cache_enabled = True
+word_cache_capacity = 200000
+
+# 토크나이저 불용어에 DB stopwords 테이블의 단어를 함께 사용 (stopwords_meta 버전이 바뀐 경우에만 다시 읽음)
+db_stopwords_enabled = True
+
+# MariaDB 연결 풀: 유지할 최소/최대 연결 수, 유휴 연결을 닫는 시간(초), 연결을 빌릴 때 최대 대기 시간(초)
+db_pool_min_size = 1
+db_pool_max_size = 10
+db_pool_idle_timeout = 300
+db_pool_borrow_timeout = 30
+
+# 앱 시작 시 DB 스키마 마이그레이션(bp/dbms/migrations.py) 적용. 끄면 python -m bp.dbms.migrations로 직접 실행
+db_migrate_on_startup = True
+
+# document_tokens 적재 방식: insert는 크기를 제한한 다중 행 INSERT(청크마다 커밋), load_data는 LOAD DATA LOCAL INFILE
+# load_data는 DB 서버의 local_infile이 켜져 있어야 하며, 실패하면 insert로 다시 적재
+bulk_insert_mode = 'insert'
+bulk_insert_max_bytes = 4 * 1024 * 1024  # INSERT 한 번의 최대 크기 (max_allowed_packet보다 작게)
+bulk_insert_max_rows = 5000              # INSERT 한 번의 최대 행 수
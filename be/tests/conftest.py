@@ -0,0 +1,5 @@
+import os
+import sys
+
+# be/ 를 import 경로에 추가 (config, bp 패키지)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,204 @@
+"""
+analysis_document의 벡터화 통계가 기존 그룹별 계산과 같은 값을 내는지 확인합니다.
+"""
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+pytest.importorskip("pydantic")
+pytest.importorskip("sqlalchemy")
+
+from bp.services.document_token.analysis_document import (
+    _group_gap_stats, compute_token_stats_by_word, compute_token_stats_streaming, compute_document_statistics
+)
+from bp.services.document_token.token_buffer import TokenBuffer
+
+
+def _reference_gap_stats(indices):
+    # 기존 방식: 그룹별 정렬 후 np.mean/np.std
+    sorted_indices = sorted(indices)
+    gap_values = [j - i for i, j in zip(sorted_indices[:-1], sorted_indices[1:])]
+    gap_avg = float(np.mean(gap_values)) if gap_values else 0.0
+    gap_sd = float(np.std(gap_values)) if len(gap_values) > 1 else 0.0
+    return gap_avg, gap_sd
+
+
+def _random_tokens(seed, token_count=5000, word_count=300, segment_size=400):
+    rng = np.random.default_rng(seed)
+    indices = np.cumsum(rng.integers(0, 4, token_count))
+    words = rng.integers(0, word_count, token_count)
+    segs = indices // segment_size + 1
+    order = rng.permutation(token_count)  # 토큰 순서와 인덱스 순서가 달라도 같은 결과
+    return words[order], segs[order], indices[order]
+
+
+def _with_fixed_groups(words, segs, indices):
+    # 간격 0, 1, 2, 8, 9, 40개인 그룹을 항상 포함 (bincount 경로와 np.std 경로의 경계)
+    rng = np.random.default_rng(1)
+    extra_words, extra_segs, extra_indices = [], [], []
+    for k, size in enumerate([1, 2, 3, 9, 10, 41]):
+        extra_words += [-(k + 1)] * size
+        extra_segs += [1] * size
+        extra_indices += sorted(rng.choice(10_000, size, replace=False).tolist())
+    return (np.concatenate([words, extra_words]), np.concatenate([segs, extra_segs]),
+            np.concatenate([indices, extra_indices]))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_group_gap_stats_matches_reference(seed):
+    words, segs, indices = _with_fixed_groups(*_random_tokens(seed))
+
+    order, group_starts, counts, gap_avg, gap_sd, first_pos, last_pos = _group_gap_stats(words, segs, indices)
+
+    reference = defaultdict(list)
+    for position, (word, seg_id, idx) in enumerate(zip(words.tolist(), segs.tolist(), indices.tolist())):
+        reference[(word, seg_id)].append((position, idx))
+
+    gap_counts = set()
+    assert len(group_starts) == len(reference)
+    for g in range(len(group_starts)):
+        key = (int(words[last_pos[g]]), int(segs[last_pos[g]]))
+        positions = [position for position, _ in reference[key]]
+        group_indices = [idx for _, idx in reference[key]]
+
+        assert counts[g] == len(group_indices)
+        assert first_pos[g] == min(positions) and last_pos[g] == max(positions)
+        assert indices[order[group_starts[g]:group_starts[g] + counts[g]]].tolist() == sorted(group_indices)
+        # 같은 순서로 더하므로 근삿값이 아니라 같은 값이어야 함
+        assert (gap_avg[g], gap_sd[g]) == _reference_gap_stats(group_indices)
+        gap_counts.add(len(group_indices) - 1)
+
+    assert {0, 1, 2, 8, 9}.issubset(gap_counts) and max(gap_counts) >= 40
+
+
+def test_token_stats_match_per_group_loop():
+    words, segs, indices = _random_tokens(3, token_count=2000)
+    # 토큰 순서대로 적재 (분할 안에서 인덱스 순)
+    order = np.lexsort((indices, segs))
+    buffer = TokenBuffer("kor")
+    rows = []
+    for position in order.tolist():
+        row = (f"w{words[position]}", "noun" if words[position] % 3 else "verb",
+               "전화번호" if words[position] == 7 else None, int(indices[position]), int(segs[position]))
+        buffer.append(*row)
+        rows.append(row)
+    buffer.end_segment()
+
+    # 기존 방식: 그룹이 처음 등장한 순서, 품사/개인정보 유형/index는 그룹의 마지막 토큰 값
+    expected = {}
+    for word, tag, pii_type, idx, seg_id in rows:
+        entry = expected.setdefault((word, seg_id), {"index_list": []})
+        entry.update(word_type=tag, pii_type=pii_type, index=idx)
+        entry["index_list"].append(idx)
+
+    tokens = compute_token_stats_by_word(buffer, "doc", "docs/doc.pdf", "기술", "AI")
+
+    assert [(token.value, token.col_id) for token in tokens] == list(expected)
+    for token in tokens:
+        entry = expected[(token.value, token.col_id)]
+        assert token.index_list == sorted(entry["index_list"])
+        assert token.col_cnt == len(entry["index_list"])
+        assert (token.word_type, token.pii_type, token.index) == (entry["word_type"], entry["pii_type"], entry["index"])
+        assert (token.gap_avg, token.gap_sd) == _reference_gap_stats(entry["index_list"])
+
+
+def test_streaming_matches_whole_document():
+    words, segs, indices = _random_tokens(4, token_count=2000)
+    order = np.lexsort((indices, segs))
+    segment_buffers = []
+    for seg_id in sorted(set(segs.tolist())):
+        buffer = TokenBuffer("kor")
+        for position in order[segs[order] == seg_id].tolist():
+            buffer.append(f"w{words[position]}", "noun", None, int(indices[position]), seg_id)
+        buffer.end_segment()
+        segment_buffers.append(buffer)
+    document_buffer = TokenBuffer("kor")
+    for buffer in segment_buffers:
+        document_buffer.extend(buffer)
+
+    streamed = compute_token_stats_streaming(iter(segment_buffers), "doc", "docs/doc.pdf", "기술", "AI")
+    whole = compute_token_stats_by_word(document_buffer, "doc", "docs/doc.pdf", "기술", "AI")
+
+    assert [token.model_dump() for token in streamed] == [token.model_dump() for token in whole]
+
+
+def _reference_document_statistics(df):
+    # 기존 DocumentParsingService.get_document_statistics의 단어별 필터링 방식
+    statistics = {
+        "total_words": int(len(df)),
+        "word_types": df['word_type'].value_counts().to_dict(),
+        "word_statistics": {},
+    }
+    all_col_ids = sorted(df['col_id'].unique())
+    all_word_frequencies = []
+    for word, word_group in df.groupby('word'):
+        all_frequencies = pd.Series(0, index=all_col_ids)
+        all_frequencies.update(word_group.groupby('col_id')['col_cnt'].sum())
+        all_word_frequencies.extend(all_frequencies.values)
+        first_row = word_group.iloc[0]
+        total_count = int(df[df['word'] == word]['col_cnt'].sum())
+        statistics["word_statistics"][word] = {
+            'average': float(all_frequencies.mean()),
+            'std_dev': float(all_frequencies.std()),
+            'word_type': first_row['word_type'],
+            'total_cnt': total_count,
+            'cate1_cnt': int(df[(df['word'] == word) & (df['cate1'] == first_row['cate1'])]['col_cnt'].sum()),
+            'cate2_cnt': int(df[(df['word'] == word) & (df['cate2'] == first_row['cate2'])]['col_cnt'].sum()),
+            'doc_cnt': total_count,
+            'segment_frequencies': all_frequencies.to_dict(),
+        }
+    statistics["overall_statistics"] = {
+        "average": float(pd.Series(all_word_frequencies).mean()),
+        "std_dev": float(pd.Series(all_word_frequencies).std()),
+    }
+    return statistics
+
+
+def _statistics_rows(seed, row_count=3000):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'word': [f"단어{i}" for i in rng.integers(0, 200, row_count)],
+        'word_type': rng.choice(['noun', 'verb', None], row_count, p=[0.6, 0.3, 0.1]),
+        'col_id': rng.integers(1, 40, row_count),
+        'col_cnt': rng.integers(1, 6, row_count),
+        'cate1': rng.choice(['기술', '경제', None], row_count, p=[0.6, 0.3, 0.1]),
+        'cate2': rng.choice(['AI', None], row_count, p=[0.8, 0.2]),
+    })
+    # 첫 행의 품사/분류가 비어 있고 다음 행에는 값이 있는 단어 (groupby.first()와 iloc[0]의 결과가 다름)
+    first_null = pd.DataFrame({
+        'word': ['빈값', '빈값', '빈값', '한번'],
+        'word_type': [None, 'noun', 'noun', None],
+        'col_id': [1, 2, 3, 5],
+        'col_cnt': [2, 3, 4, 1],
+        'cate1': [None, '기술', '기술', None],
+        'cate2': [None, 'AI', None, 'AI'],
+    })
+    return pd.concat([first_null, df], ignore_index=True)
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_document_statistics_match_reference(seed):
+    df = _statistics_rows(seed)
+
+    statistics = compute_document_statistics(df)
+    expected = _reference_document_statistics(df)
+
+    assert statistics["total_words"] == expected["total_words"]
+    assert statistics["word_types"] == expected["word_types"]
+    assert statistics["overall_statistics"] == pytest.approx(expected["overall_statistics"])
+    assert list(statistics["word_statistics"]) == list(expected["word_statistics"])
+    for word, word_statistics in statistics["word_statistics"].items():
+        reference = expected["word_statistics"][word]
+        assert word_statistics['word_type'] == reference['word_type'] \
+            or pd.isna(word_statistics['word_type']) and pd.isna(reference['word_type']), word
+        for key in ('total_cnt', 'cate1_cnt', 'cate2_cnt', 'doc_cnt', 'segment_frequencies'):
+            assert word_statistics[key] == reference[key], (word, key)
+        assert word_statistics['average'] == pytest.approx(reference['average'])
+        assert word_statistics['std_dev'] == pytest.approx(reference['std_dev'], nan_ok=True)
+
+    # 첫 행의 빈 값은 그대로 사용하고, 빈 분류 값과 같은 행은 없음
+    assert pd.isna(statistics["word_statistics"]["빈값"]["word_type"])
+    assert statistics["word_statistics"]["빈값"]["cate1_cnt"] == 0
@@ -0,0 +1,230 @@
+"""
+document_token_repository의 청크 적재와 빈도 집계 테이블 반영 테스트
+
+MariaDB 없이 트랜잭션(begin/commit/rollback과 autocommit)을 흉내 내는 가짜 연결로 확인합니다.
+"""
+import copy
+import re
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("pymysql")
+pytest.importorskip("flask")
+pytest.importorskip("pydantic")
+pytest.importorskip("sqlalchemy")
+
+from bp.repositories import document_token_repository
+from bp.repositories.document_token_repository import DocumentTokenRepository
+
+aggregate_tables = ["word_totals", "word_domain", "word_cate1", "word_cate2", "word_doc"]
+
+
+class FakeConnection:
+    """
+    autocommit 연결: begin() 밖의 문장은 바로 반영되고, begin() 안의 문장은 commit()해야 반영됨
+    """
+    def __init__(self, fail_on_aggregate: int = None):
+        self.committed = {table: Counter() for table in aggregate_tables}
+        self.pending = None
+        self.aggregate_statements = 0
+        self.fail_on_aggregate = fail_on_aggregate  # n번째 집계 문장에서 오류
+        self.deleted = False
+        self.token_inserts = []  # document_tokens INSERT 문장
+
+    def begin(self):
+        self.pending = copy.deepcopy(self.committed)
+
+    def commit(self):
+        if self.pending is not None:
+            self.committed, self.pending = self.pending, None
+
+    def rollback(self):
+        self.pending = None
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+class FakeCursor:
+    def __init__(self, conn: FakeConnection):
+        self.conn = conn
+        self.lastrowid = 0
+
+    def mogrify(self, query, args):
+        return query % tuple(repr(arg) for arg in args)
+
+    def execute(self, query, args=None):
+        if query.lstrip().startswith("DELETE FROM document_tokens"):
+            self.conn.deleted = True
+            return
+        table = re.search(r"INSERT INTO (\w+)", query).group(1)
+        if table == "document_tokens":
+            self.conn.token_inserts.append(query)
+            self.lastrowid += 100
+            return
+        self.conn.aggregate_statements += 1
+        if self.conn.aggregate_statements == self.conn.fail_on_aggregate:
+            raise RuntimeError(f"{table} 갱신 실패")
+        state = self.conn.pending if self.conn.pending is not None else self.conn.committed
+        state[table]["word"] += 1
+
+
+def _repository(conn: FakeConnection) -> DocumentTokenRepository:
+    repository = DocumentTokenRepository.__new__(DocumentTokenRepository)
+    repository.conn = conn
+    repository.cursor = conn.cursor()
+    return repository
+
+
+def _rows(n: int):
+    return [tuple([f"w{i}"] + [1] * (len(document_token_repository.token_columns) - 1)) for i in range(n)]
+
+
+def test_insert_chunks_updates_all_aggregates(monkeypatch):
+    monkeypatch.setattr(document_token_repository, "bulk_insert_max_rows", 3)
+    conn = FakeConnection()
+
+    assert _repository(conn)._insert_chunks(_rows(8), ["doc.pdf"]) == 8
+    assert all(conn.committed[table]["word"] == 1 for table in aggregate_tables)
+
+
+def test_insert_chunks_aggregate_failure_is_atomic(monkeypatch):
+    monkeypatch.setattr(document_token_repository, "bulk_insert_max_rows", 3)
+    conn = FakeConnection(fail_on_aggregate=3)
+
+    with pytest.raises(RuntimeError):
+        _repository(conn)._insert_chunks(_rows(8), ["doc.pdf"])
+
+    # 앞의 두 집계 테이블도 반영되지 않고, 적재한 행은 지움
+    assert all(conn.committed[table]["word"] == 0 for table in aggregate_tables)
+    assert conn.deleted
+
+
+def test_insert_chunks_limit_counts_utf8_bytes(monkeypatch):
+    # 한글 행은 글자 수보다 UTF-8 바이트가 3배 길어, 글자 수로 나누면 패킷 상한을 넘음
+    rows = [tuple([f"형태소분석{i}" * 10] + [1] * (len(document_token_repository.token_columns) - 1))
+            for i in range(8)]
+    repository = _repository(FakeConnection())
+    placeholder = "(" + ", ".join(["%s"] * len(rows[0])) + ")"
+    row_bytes = len(repository.cursor.mogrify(placeholder, rows[0]).encode("utf-8"))
+    max_bytes = 500 + 3 * row_bytes  # 행 3개 남짓: 글자 수로 세면 한 문장에 훨씬 많이 들어감
+    monkeypatch.setattr(document_token_repository, "bulk_insert_max_bytes", max_bytes)
+
+    assert repository._insert_chunks(rows, ["doc.pdf"]) == 8
+    statements = repository.conn.token_inserts
+    assert len(statements) > 1
+    assert all(len(statement.encode("utf-8")) <= max_bytes for statement in statements)
+
+
+class RecordingCursor:
+    def __init__(self):
+        self.upserts = {}
+
+    def executemany(self, query, args):
+        table = re.search(r"INSERT INTO (\w+)", query).group(1)
+        self.upserts[table] = sorted(args)
+
+
+def test_load_data_aggregates_from_loaded_rows():
+    # LOAD DATA 경로는 id 범위 대신 적재한 행으로 집계 (innodb_autoinc_lock_mode와 무관)
+    columns = document_token_repository.token_columns
+
+    def row(value, document_name, cate1, cate2, document_path, col_cnt):
+        values = dict.fromkeys(columns, 1)
+        values.update(value=value, document_name=document_name, cate1=cate1, cate2=cate2,
+                      document_path=document_path, col_cnt=col_cnt)
+        return tuple(values[column] for column in columns)
+
+    rows = [
+        row("선도", "AGI", "기술", "AI", "a.pdf", 3),
+        row("선도", "AGI", "기술", "ML", "a.pdf", 2),
+        row("선도", "AGI", "경제", "AI", "b.pdf", None),
+        row("분야", "AGI", "기술", "AI", "a.pdf", 1),
+    ]
+    cursor = RecordingCursor()
+    repository = DocumentTokenRepository.__new__(DocumentTokenRepository)
+    repository.cursor = cursor
+
+    repository._upsert_row_frequencies(rows)
+
+    assert cursor.upserts == {
+        "word_totals": [("분야", 1), ("선도", 5)],
+        "word_domain": [("분야", "AGI", 1), ("선도", "AGI", 5)],
+        "word_cate1": [("분야", "기술", 1), ("선도", "경제", 0), ("선도", "기술", 5)],
+        "word_cate2": [("분야", "AI", 1), ("선도", "AI", 3), ("선도", "ML", 2)],
+        "word_doc": [("분야", "a.pdf", 1), ("선도", "a.pdf", 5), ("선도", "b.pdf", 0)],
+    }
+
+
+class DeleteConnection:
+    def __init__(self, row, fail_on: str = None):
+        self.row = row
+        self.fail_on = fail_on  # 이 테이블 갱신에서 오류
+        self.events = []
+        self.decrements = {}
+
+    def begin(self):
+        self.events.append("begin")
+
+    def commit(self):
+        self.events.append("commit")
+
+    def rollback(self):
+        self.events.append("rollback")
+
+
+class DeleteCursor:
+    def __init__(self, conn: DeleteConnection):
+        self.conn = conn
+        self.rowcount = 0
+
+    def execute(self, query, args=None):
+        if query.startswith("SELECT"):
+            self.result = self.conn.row
+        elif query.startswith("DELETE"):
+            self.rowcount = 1
+        else:
+            table = re.search(r"UPDATE (\w+)", query).group(1)
+            if table == self.conn.fail_on:
+                raise RuntimeError(f"{table} 갱신 실패")
+            self.conn.decrements[table] = args
+
+    def fetchone(self):
+        return self.result
+
+
+def _delete_repository(conn: DeleteConnection) -> DocumentTokenRepository:
+    repository = DocumentTokenRepository.__new__(DocumentTokenRepository)
+    repository.conn = conn
+    repository.cursor = DeleteCursor(conn)
+    return repository
+
+
+def test_delete_token_decrements_all_aggregates():
+    conn = DeleteConnection(("선도", "AGI", "기술", "AI", "a.pdf", 3))
+
+    assert _delete_repository(conn).delete_token_by_id(7) == 1
+    assert conn.events == ["begin", "commit"]
+    assert conn.decrements == {
+        "word_totals": (3, "선도"),
+        "word_domain": (3, "선도", "AGI"),
+        "word_cate1": (3, "선도", "기술"),
+        "word_cate2": (3, "선도", "AI"),
+        "word_doc": (3, "선도", "a.pdf"),
+    }
+
+
+def test_delete_token_aggregate_failure_rolls_back():
+    conn = DeleteConnection(("선도", "AGI", "기술", "AI", "a.pdf", 3), fail_on="word_cate2")
+
+    with pytest.raises(RuntimeError):
+        _delete_repository(conn).delete_token_by_id(7)
+    assert conn.events == ["begin", "rollback"]
+
+
+def test_delete_missing_token_changes_nothing():
+    conn = DeleteConnection(None)
+
+    assert _delete_repository(conn).delete_token_by_id(7) == 0
+    assert conn.decrements == {}
@@ -0,0 +1,89 @@
+"""
+ParseJob의 문서 단위 시간/메모리 제한과 취소를 확인합니다. (워커 프로세스는 띄우지 않음)
+"""
+import time
+
+import pytest
+
+pytest.importorskip("psutil")
+
+from bp.services.document_token import parser_pool
+from bp.services.document_token.parser_pool import (
+    ParserPool, ParseJob, ParseCancelledError, ParseMemoryError, ParseTimeoutError
+)
+
+
+class FakeWorker:
+    def __init__(self, rss: int):
+        self.rss = rss
+
+    def rss_bytes(self) -> int:
+        return self.rss
+
+
+def test_deadline_is_shared_by_all_tasks_of_a_document():
+    job = ParseJob(timeout=0.05, max_rss_bytes=None)
+    job.start()
+    job.check()
+    time.sleep(0.1)
+    job.start()  # 뒤 구간이 워커를 얻어도 제한 시간은 다시 시작하지 않음
+
+    # 앞 구간에서 시간을 다 쓴 뒤 시작하는 구간도 같은 제한을 받음
+    with pytest.raises(ParseTimeoutError):
+        job.check()
+
+
+def test_deadline_starts_when_the_first_task_gets_a_worker():
+    job = ParseJob(timeout=0.05, max_rss_bytes=None)
+    time.sleep(0.1)
+
+    # 워커를 기다린 시간은 제한 시간에 포함하지 않음
+    job.check()
+    job.start()
+    job.check()
+
+
+def test_memory_limit_applies_to_the_sum_of_document_workers():
+    job = ParseJob(timeout=None, max_rss_bytes=100)
+    first, second = FakeWorker(60), FakeWorker(60)
+    job.attach(first)
+    job.check()
+
+    job.attach(second)
+    with pytest.raises(ParseMemoryError):
+        job.check()
+
+    job.detach(second)
+    job.check()
+
+
+def test_run_does_not_start_cancelled_or_expired_jobs():
+    pool = ParserPool(workers=1, threads_per_worker=1, timeout=0.01)
+    try:
+        cancelled = pool.new_job()
+        cancelled.cancel()
+        with pytest.raises(ParseCancelledError):
+            pool.submit(time.sleep, 0, job=cancelled).result()
+
+        expired = pool.new_job()
+        expired.start()
+        time.sleep(0.05)
+        with pytest.raises(ParseTimeoutError):
+            pool.submit(time.sleep, 0, job=expired).result()
+        assert pool._idle.get_nowait() is None  # 워커를 띄우지 않음
+    finally:
+        pool.shutdown()
+
+
+def test_worker_slot_is_returned_when_spawn_fails(monkeypatch):
+    def fail_spawn(threads):
+        raise OSError("spawn failed")
+
+    monkeypatch.setattr(parser_pool, "_Worker", fail_spawn)
+    pool = ParserPool(workers=1, threads_per_worker=1)
+    try:
+        with pytest.raises(OSError):
+            pool.run(time.sleep, 0)
+        assert pool._idle.get_nowait() is None
+    finally:
+        pool.shutdown()
@@ -0,0 +1,73 @@
+"""
+pii_scanner가 개인정보를 찾고, 숫자 모양이 비슷한 날짜/ISBN/버전 표기는 개인정보로 잡지 않는지 확인합니다.
+"""
+import pytest
+
+from bp.services.document_token.pii_scanner import scan_segments, group_matches_by_word
+
+
+def _found(segments):
+    return [[(m.text, m.pii_type) for m in seg_matches] for seg_matches in scan_segments(segments)]
+
+
+def test_detects_pii_in_each_segment():
+    segments = [
+        "담당자 홍길동(hong.gd@example.co.kr, 010-1234-5678)에게 문의하세요.",
+        "주민등록번호 900101-1234567, 계좌 110-234-567890 으로 입금",
+        "서버 192.168.0.10 에서 02-123-4567 로 연결",
+        "개인정보가 없는 분할",
+    ]
+
+    assert _found(segments) == [
+        [("hong.gd@example.co.kr", "이메일 주소"), ("010-1234-5678", "전화번호")],
+        [("900101-1234567", "주민등록번호"), ("110-234-567890", "계좌번호")],
+        [("192.168.0.10", "IP 주소"), ("02-123-4567", "전화번호")],
+        [],
+    ]
+
+
+def test_match_positions_are_relative_to_segment():
+    segments = ["연락처 없음", "문의: hong.gd@example.co.kr 또는 010-1234-5678"]
+
+    for seg, seg_matches in zip(segments, scan_segments(segments)):
+        for m in seg_matches:
+            assert seg[m.start:m.end] == m.text
+
+
+def test_matches_do_not_cross_segment_boundaries():
+    # 앞 분할 끝과 뒤 분할 시작을 이으면 전화번호 모양이 되지만 분할이 다르므로 매치하지 않음
+    assert _found(["번호 010-1234", "5678 입니다"]) == [[], []]
+
+
+@pytest.mark.parametrize("segment", [
+    "계약일 2024-01-15 부터 2023-12-31 까지",
+    "입금 기한 2024-01-15",
+    "ISBN 978-89-12345 도서",
+    "라이브러리 1.2.3.4 버전, v1.2.3.4, version 10.0.0.1, 서버 버전 2.0.1.3",
+])
+def test_dates_isbns_and_versions_are_not_pii(segment):
+    assert _found([segment]) == [[]]
+
+
+def test_account_requires_context():
+    assert _found(["번호 110-234-567890 참고"]) == [[]]
+    assert _found(["국민은행 110-234-567890"]) == [[("110-234-567890", "계좌번호")]]
+    # 문맥 단어는 같은 분할 안에 있어야 함
+    assert _found(["계좌", "110-234-567890"]) == [[], []]
+
+
+def test_ip_requires_context_and_no_version_prefix():
+    assert _found(["값 192.168.0.10 참고"]) == [[]]
+    assert _found(["접속 주소 192.168.0.10"]) == [[("192.168.0.10", "IP 주소")]]
+    assert _found(["서버 version 192.168.0.10"]) == [[]]
+
+
+def test_group_matches_by_word():
+    segment = "메일 a.b@example.com 전화 010-1234-5678"
+    word_starts = [0, 3, 19, 22]
+
+    by_word = group_matches_by_word(scan_segments([segment])[0], word_starts)
+
+    assert sorted(by_word) == [1, 3]
+    assert by_word[1][0].start == 0 and by_word[1][0].text == "a.b@example.com"
+    assert by_word[3][0].start == 0 and by_word[3][0].end == len("010-1234-5678")
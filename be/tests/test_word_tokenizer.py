@@ -0,0 +1,66 @@
+"""
+분할 병렬 토큰화(workers > 1)가 순차 처리(workers=1)와 같은 토큰을 만드는지 확인합니다.
+"""
+import pytest
+
+pytest.importorskip("kiwipiepy")
+pytest.importorskip("pymysql")
+pytest.importorskip("flask")
+pytest.importorskip("pydantic")
+
+from bp.services.document_token import word_tokenizer
+from bp.services.document_token.word_tokenizer import WordTokenizer
+from bp.services.document_token.tokenizer_registry import WordAnalysisCache
+
+segments = [
+    "Google은 AI 분야를 선도하고, 또 선도하고, 계속 선도하고 있습니다.",
+    "",
+    "   ",
+    "문의: hong.gd@example.co.kr 또는 010-1234-5678로 연락 바랍니다.",
+    "주민등록번호 900101-1234567, 계좌 110-234-567890 으로 입금",
+    "공백이  두 번   들어간 분할과 끝에 공백이 있는 분할 ",
+    "서버 192.168.0.10 에서 연결",
+    "인공지능 연구 결과를 논문과 보고서로 공개하고 있습니다. " * 10,
+]
+
+
+@pytest.fixture(autouse=True)
+def no_db_stopwords(monkeypatch):
+    # DB 불용어를 읽지 않도록 불용어 사전을 고정
+    monkeypatch.setattr(word_tokenizer, "get_stopwords_snapshot", lambda: (frozenset({"있", "하"}), 0))
+
+
+@pytest.mark.parametrize("mode", ["batch", "word"])
+def test_parallel_tokenization_matches_serial(mode):
+    serial_rows = list(WordTokenizer(segments, "kor", mode=mode, workers=1).tokenization_buffer().iter_rows())
+    parallel_rows = list(WordTokenizer(segments, "kor", mode=mode, workers=4).tokenization_buffer().iter_rows())
+
+    assert serial_rows
+    assert parallel_rows == serial_rows
+
+
+@pytest.mark.parametrize("mode", ["batch", "word"])
+def test_parallel_streaming_matches_serial(mode):
+    def segment_rows(workers):
+        return [list(buffer.iter_rows())
+                for buffer in WordTokenizer(segments, "kor", mode=mode, workers=workers).iter_tokenization()]
+
+    assert segment_rows(4) == segment_rows(1)
+
+
+def test_word_cache_rejects_other_stopword_versions():
+    cache = WordAnalysisCache(capacity=10)
+    cache.validate(1)
+    cache.put("선도하고", (("선도", "NNG", None),), 1)
+
+    # 다른 스레드가 새 불용어(version 2)로 캐시를 비운 뒤 이전 불용어로 분석한 결과는 저장하지 않음
+    cache.validate(2)
+    cache.put("있습니다", (("있", "VA", None),), 1)
+    cache.validate(1)  # 늦게 도착한 이전 version으로 되돌리지 않음
+
+    assert cache.stopwords_version == 2
+    assert cache.get("선도하고", 2) is None
+    assert cache.get("있습니다", 1) is None
+    cache.put("있습니다", (), 2)
+    assert cache.get("있습니다", 2) == ()
+    assert cache.get("있습니다", 1) is None